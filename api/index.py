@@ -1,3 +1,4 @@
+import json
 import os
 import sys
 import traceback
@@ -11,7 +12,7 @@ try:
     from src.api.main import app
 except Exception as e:
     # Fallback app that shows the error for debugging
-    from fastapi import FastAPI
+    from fastapi import FastAPI, Response
     from fastapi.middleware.cors import CORSMiddleware
     
     app = FastAPI(title="Betting AI System API (fallback)")
@@ -24,17 +25,39 @@ except Exception as e:
     )
     
     error_msg = f"{type(e).__name__}: {e}\n{traceback.format_exc()}"
-    
+
+    # The project root doesn't change within a process — list it once
+    _root_listing = None
+
+    def _get_root_listing():
+        global _root_listing
+        if _root_listing is None:
+            if os.path.isdir(root):
+                with os.scandir(root) as it:
+                    _root_listing = [entry.name for _, entry in zip(range(20), it)]
+            else:
+                _root_listing = "not a dir"
+        return _root_listing
+
+    # The failure is process-constant, so serialize the payload once
+    _fallback_body = None
+
+    def _get_fallback_body():
+        global _fallback_body
+        if _fallback_body is None:
+            _fallback_body = json.dumps({
+                "status": "error",
+                "message": "App failed to load",
+                "error": error_msg,
+                "python_path": sys.path[:5],
+                "cwd": os.getcwd(),
+                "root": root,
+                "files": _get_root_listing()
+            }).encode()
+        return _fallback_body
+
     @app.get("/")
     @app.get("/health")
     @app.get("/api/v1/betting/top3")
     async def fallback_handler():
-        return {
-            "status": "error",
-            "message": "App failed to load",
-            "error": error_msg,
-            "python_path": sys.path[:5],
-            "cwd": os.getcwd(),
-            "root": root,
-            "files": os.listdir(root)[:20] if os.path.isdir(root) else "not a dir"
-        }
+        return Response(content=_get_fallback_body(), status_code=500, media_type="application/json")
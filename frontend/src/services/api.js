@@ -135,7 +135,7 @@ export const bettingAPI = {
 
   // Ledger — all recorded bets with P&L
   getLedger: async (limit = 100, status = null) => {
-    const params = { limit };
+    const params = { limit, format: 'json' };
     if (status) params.status = status;
     const response = await api.get('/api/v1/betting/ledger', { params });
     return response.data;
@@ -1,7 +1,7 @@
 """
 Setup script for Betting AI System
 """
-from setuptools import setup, find_packages
+from setuptools import setup
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
@@ -18,7 +18,21 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/yourusername/betting-ai-system",
-    packages=find_packages(),
+    # Explicit list: most subpackages have no __init__.py, so find_packages()
+    # would only pick up src and src.services
+    packages=[
+        "src",
+        "src.api",
+        "src.api.routes",
+        "src.cli",
+        "src.data_ingestion",
+        "src.database",
+        "src.integrations",
+        "src.ml_models",
+        "src.recommendation",
+        "src.services",
+        "src.utils",
+    ],
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -34,8 +48,4 @@ setup(
             "betting-ai=src.cli.commands:cli",
         ],
     },
-    include_package_data=True,
-    package_data={
-        "": ["*.yaml", "*.yml", "*.json"],
-    },
 )
@@ -1,13 +1,27 @@
 """
 FastAPI Main Application
 """
-from fastapi import FastAPI, Depends, HTTPException
+import asyncio
+import os
+import signal
+import time
+from datetime import datetime, timezone
+from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
-from sqlalchemy import text
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
+from anyio import to_thread
+from sqlalchemy import exists, func, insert, select
+
+try:
+    from brotli_asgi import BrotliMiddleware
+except ImportError:
+    BrotliMiddleware = None
 
-from src.database.database import get_db_session, init_database, close_database
+from src.database.database import (
+    db_manager, ensure_schema, close_database, close_async_database, insert_ignore
+)
 from src.api.routes import betting_routes, crypto_routes
 from src.utils.logger import get_logger
 from src.utils.config_loader import get_config
@@ -15,18 +29,35 @@ from src.utils.config_loader import get_config
 logger = get_logger(__name__)
 config = get_config()
 
+# Set once demo seeding and model training have finished (readiness)
+model_ready = asyncio.Event()
+
+# Worker threads for sync handlers and run_in_threadpool/to_thread calls
+# (AnyIO's default is 40, which blocking DB/wallet calls exhaust under load)
+API_THREADPOOL_SIZE = int(os.getenv("API_THREADPOOL_SIZE", "200"))
+
+# [monotonic time of last refresh, formatted UTC timestamp]
+_ts_cache = [float("-inf"), ""]
+
+
+def _now_iso() -> str:
+    """Current UTC time as ISO 8601, re-formatted at most once per second."""
+    now = time.monotonic()
+    if now - _ts_cache[0] > 1.0:
+        _ts_cache[0] = now
+        _ts_cache[1] = datetime.now(timezone.utc).isoformat()
+    return _ts_cache[1]
+
 
 def _seed_demo_data_if_empty():
     """Seed demo events/odds when the database has no events (fresh deploy)."""
-    from src.database.database import db_manager
     from src.database.models import Sport, Event, Odds
     from datetime import datetime, timedelta
 
     try:
         with db_manager.get_session() as db:
-            event_count = db.query(Event).count()
-            if event_count > 0:
-                logger.info(f"Database already has {event_count} events — skipping seed")
+            if db.execute(select(exists().where(Event.id.isnot(None)))).scalar():
+                logger.info("Database already has events — skipping seed")
                 return
 
             logger.info("Empty database detected — seeding demo data")
@@ -68,53 +99,62 @@ def _seed_demo_data_if_empty():
                 "Betfair":     {"home": 2.30, "away": 2.40, "draw": 3.50},
             }
 
-            sports_map = {}
-            for s in demo_sports:
-                existing = db.query(Sport).filter(Sport.name == s["name"]).first()
-                if existing:
-                    sports_map[s["name"]] = existing
-                else:
-                    new_sport = Sport(name=s["name"], category=s["category"], is_active=True)
-                    db.add(new_sport)
-                    db.flush()
-                    sports_map[s["name"]] = new_sport
-
-            events_created = 0
-            odds_created = 0
-
-            for ev in demo_events:
-                existing = db.query(Event).filter(Event.external_id == ev["external_id"]).first()
-                if existing:
-                    continue
-
-                db_event = Event(
-                    sport_id=sports_map[ev["sport"]].id,
-                    external_id=ev["external_id"],
-                    name=ev["name"],
-                    home_team=ev["home_team"],
-                    away_team=ev["away_team"],
-                    start_time=now + timedelta(hours=ev["hours"]),
-                    status="upcoming",
-                    venue="Demo Arena",
-                )
-                db.add(db_event)
-                db.flush()
-                events_created += 1
-
-                for bookmaker, selections in bookmaker_odds.items():
-                    for selection, odds_decimal in selections.items():
-                        # Skip draw for tennis
-                        if ev["sport"] == "tennis" and selection == "draw":
-                            continue
-                        db.add(Odds(
-                            event_id=db_event.id,
-                            bookmaker=bookmaker,
-                            market_type="h2h",
-                            selection=selection,
-                            odds_decimal=odds_decimal,
-                            is_current=True,
-                        ))
-                        odds_created += 1
+            # Sports: one idempotent bulk insert, then one lookup for their ids
+            sport_rows = [
+                {"name": s["name"], "category": s["category"], "is_active": True}
+                for s in demo_sports
+            ]
+            db.execute(
+                insert_ignore(db, Sport)
+                .values(sport_rows)
+                .on_conflict_do_nothing(index_elements=["name"])
+            )
+            sport_ids = dict(db.execute(
+                select(Sport.name, Sport.id)
+                .where(Sport.name.in_([s["name"] for s in demo_sports]))
+            ).all())
+
+            # Events: one bulk insert; RETURNING only yields rows actually inserted
+            event_rows = [
+                {
+                    "sport_id": sport_ids[ev["sport"]],
+                    "external_id": ev["external_id"],
+                    "name": ev["name"],
+                    "home_team": ev["home_team"],
+                    "away_team": ev["away_team"],
+                    "start_time": now + timedelta(hours=ev["hours"]),
+                    "status": "upcoming",
+                    "venue": "Demo Arena",
+                }
+                for ev in demo_events
+            ]
+            result = db.execute(
+                insert_ignore(db, Event)
+                .values(event_rows)
+                .on_conflict_do_nothing(index_elements=["external_id"])
+                .returning(Event.id, Event.external_id)
+            )
+            event_ids = {row.external_id: row.id for row in result}
+            events_created = len(event_ids)
+
+            # Odds: plain dict rows through Core executemany — no ORM objects,
+            # identity-map bookkeeping or per-row __init__ (no draw in tennis)
+            event_pairs = [
+                (ev, event_ids[ev["external_id"]])
+                for ev in demo_events
+                if ev["external_id"] in event_ids
+            ]
+            odds_rows = [
+                {"event_id": event_id, "bookmaker": bm, "market_type": "h2h",
+                 "selection": sel, "odds_decimal": v, "is_current": True}
+                for ev, event_id in event_pairs
+                for bm, sels in bookmaker_odds.items()
+                for sel, v in sels.items()
+                if not (ev["sport"] == "tennis" and sel == "draw")
+            ]
+            if odds_rows:
+                db.execute(insert(Odds), odds_rows)
+            odds_created = len(odds_rows)
 
             logger.info(f"Seeded {events_created} events, {odds_created} odds entries")
 
@@ -127,86 +167,155 @@ async def _try_fetch_live_odds():
     try:
         from src.data_ingestion.odds_ingestion_service import OddsIngestionService
         service = OddsIngestionService()
-        await service.fetch_and_store_odds()
-        logger.info("Live odds fetch completed")
-
-        # Check if we actually got events
-        from src.database.database import db_manager
-        from src.database.models import Event
-        with db_manager.get_session() as db:
-            count = db.query(Event).count()
-            logger.info(f"Database now has {count} events after live fetch")
-            return count > 0
+        stored = await service.fetch_and_store_odds()
+        logger.info(f"Live odds fetch completed — {stored} events stored")
+        return stored > 0
     except Exception as e:
         logger.warning(f"Live odds fetch failed: {e}")
         return False
 
 
+def _odds_fingerprint() -> str:
+    """Cheap "has the training data changed?" key: latest odds timestamp + row count."""
+    from src.database.models import Odds
+
+    with db_manager.get_session() as db:
+        latest, count = db.execute(select(func.max(Odds.timestamp), func.count(Odds.id))).one()
+    return f"{latest.isoformat() if latest else ''}:{count}"
+
+
 def _ensure_trained_model():
     """Train or load the XGBoost model so predictions are real, not defaults."""
-    import os
     from pathlib import Path
 
     model_path = Path("data/models/xgboost_latest.pkl")
+    fingerprint_path = model_path.with_suffix(".fingerprint")
 
     if model_path.exists():
         logger.info(f"Trained model found at {model_path}")
         return
 
-    # No model on disk — train one from current odds data
+    # Skip the dataset build entirely if the odds haven't changed since the
+    # last training attempt (e.g. it was skipped for too few samples)
+    try:
+        fingerprint = _odds_fingerprint()
+    except Exception as e:
+        logger.warning(f"Could not fingerprint odds data: {e}")
+        fingerprint = None
+    if fingerprint and fingerprint_path.exists() and fingerprint_path.read_text() == fingerprint:
+        logger.info("Odds unchanged since last training attempt — skipping training")
+        return
+
+    # No model on disk — train one from current odds data.  The training
+    # stack (pandas/xgboost/sklearn) is only imported on this cold path.
     logger.info("No trained model found — training from current odds data...")
     try:
         from train_model import build_training_dataset, train_model, save_trained_model
         df = build_training_dataset()
         if len(df) < 20:
             logger.warning(f"Only {len(df)} training samples — skipping training")
-            return
-        model = train_model(df)
-        save_trained_model(model)
-        logger.info("Model trained and saved on startup")
+        else:
+            model = train_model(df)
+            save_trained_model(model)
+            logger.info("Model trained and saved on startup")
+        if fingerprint:
+            fingerprint_path.parent.mkdir(parents=True, exist_ok=True)
+            fingerprint_path.write_text(fingerprint)
     except Exception as e:
         logger.error(f"Auto-training failed: {e}")
 
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """Application lifespan manager"""
-    # Startup
-    logger.info("Starting Betting AI System API")
-    init_database()
+def _warm_ensemble():
+    """Load the route ensemble and run one synthetic prediction so the first request doesn't pay for it."""
+    try:
+        ensemble = betting_routes.get_ensemble_predictor()
+        ensemble.predict({
+            'event_id': 0,
+            'event_name': 'Warmup Home vs Warmup Away',
+            'sport': 'soccer',
+            'home_team': 'Warmup Home',
+            'away_team': 'Warmup Away',
+            'home_odds': 2.0,
+            'away_odds': 2.0,
+            'draw_odds': 3.0
+        })
+        logger.info("Ensemble predictor warmed up")
+    except Exception as e:
+        logger.warning(f"Ensemble warm-up failed: {e}")
+
+
+async def _background_startup():
+    """Create the schema, load data and train off the critical path, then start the auto-bet loop."""
+    # Schema creation is the first network round-trip to the database; it
+    # retries with backoff so a DB that's still booting doesn't crash the app.
+    # Once retries run out, ask the server to shut down rather than keep
+    # serving a half-started API (/ready stuck at 503, no auto-bet loop).
+    # SIGTERM goes through the normal graceful shutdown, so the lifespan
+    # still closes HTTP clients, the wallet and both database engines
+    try:
+        await asyncio.to_thread(ensure_schema)
+    except Exception as e:
+        logger.critical(f"Database unavailable, startup aborted — shutting down: {e}")
+        os.kill(os.getpid(), signal.SIGTERM)
+        return
     logger.info("Database initialized")
 
-    # Try fetching live odds first (await it so we have data before serving)
+    # Try fetching live odds first; fall back to demo seed only if it got nothing
     live_success = await _try_fetch_live_odds()
-
-    # Fall back to demo seed only if live fetch got nothing
     if not live_success:
-        _seed_demo_data_if_empty()
+        await asyncio.to_thread(_seed_demo_data_if_empty)
 
     # Ensure ML model is trained (uses DB odds data)
-    _ensure_trained_model()
+    await asyncio.to_thread(_ensure_trained_model)
 
     # Reset the predictor singleton so it picks up the trained model
-    from src.api.routes.betting_routes import _ensemble_predictor
-    import src.api.routes.betting_routes as br
-    br._ensemble_predictor = None
+    # (routes module is already loaded by the router include below)
+    betting_routes._build_ensemble.cache_clear()
+    betting_routes.clear_reference_caches()
+    await asyncio.to_thread(_warm_ensemble)
+
+    model_ready.set()
+    logger.info("Startup warm-up complete — API ready")
+
+    # Wallet setup is an RPC round-trip, so it doesn't hold up readiness
+    await asyncio.to_thread(crypto_routes.warm_wallet_caches)
 
     # ── Start auto-bet background loop ──
-    import asyncio
-    from src.services.auto_bet_service import auto_bet_loop, stop_auto_bet
-    auto_bet_task = asyncio.create_task(auto_bet_loop())
+    from src.services.auto_bet_service import auto_bet_loop
     logger.info("Auto-bet background loop launched")
+    await auto_bet_loop()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan manager"""
+    # Startup
+    logger.info("Starting Betting AI System API")
+    to_thread.current_default_thread_limiter().total_tokens = API_THREADPOOL_SIZE
+
+    # The engine is created lazily with no network I/O; schema creation,
+    # odds fetch, seeding, training and the auto-bet loop all run in the
+    # background so the port binds immediately; /ready reports 503 until
+    # they finish
+    startup_task = asyncio.create_task(_background_startup())
     
     yield
     
     # Shutdown
     logger.info("Shutting down Betting AI System API")
+    from src.services.auto_bet_service import stop_auto_bet
     stop_auto_bet()
-    auto_bet_task.cancel()
+    startup_task.cancel()
     try:
-        await auto_bet_task
+        await startup_task
     except asyncio.CancelledError:
         pass
+    from src.integrations.polymarket_sports import close_http_client
+    await close_http_client()
+    from src.data_ingestion.odds_api_client import close_odds_client
+    await close_odds_client()
+    crypto_routes.refresh_wallet()
+    await close_async_database()
     close_database()
 
 
@@ -215,30 +324,51 @@ app = FastAPI(
     title="Betting AI System API",
     description="AI-powered betting analysis and recommendation system",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS configuration
-import os
 api_config = config.get_api_config()
 cors_config = api_config.get('cors', {})
 
+# Server settings are read once at import; RELOAD=1 is for local development only
+API_HOST = api_config.get('host', '0.0.0.0')
+API_PORT = int(api_config.get('port', 8000))
+API_WORKERS = int(api_config.get('workers', 1))
+RELOAD = os.getenv('RELOAD') == '1'
+
 # Allow env override for CORS origins in production
 cors_origins_env = os.getenv('CORS_ORIGINS', '')
-if cors_origins_env:
-    cors_origins = [o.strip() for o in cors_origins_env.split(',')]
-else:
-    cors_origins = cors_config.get('origins', ["*"])
+# Normalized once at import; CORSMiddleware only does `origin in allow_origins`
+cors_origins = tuple(
+    o.strip().lower()
+    for o in (cors_origins_env.split(',') if cors_origins_env else cors_config.get('origins', ["*"]))
+    if o.strip()
+)
 
 if cors_config.get('enabled', True):
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=cors_origins,
+        # Large allow-lists get O(1) membership checks instead of a linear scan
+        allow_origins=frozenset(cors_origins) if len(cors_origins) > 32 else cors_origins,
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
     )
 
+# Compress JSON list payloads (mostly repeated field names); bodies under
+# COMPRESSION_MIN_SIZE bytes aren't worth the CPU. Brotli when available,
+# with gzip for clients that don't accept it.
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "512"))
+
+if BrotliMiddleware is not None:
+    app.add_middleware(
+        BrotliMiddleware, quality=4, minimum_size=COMPRESSION_MIN_SIZE, gzip_fallback=True
+    )
+else:
+    app.add_middleware(GZipMiddleware, minimum_size=COMPRESSION_MIN_SIZE)
+
 # Include routers
 app.include_router(betting_routes.router, prefix="/api/v1/betting", tags=["betting"])
 app.include_router(crypto_routes.router, prefix="/api/v1/crypto", tags=["crypto"])
@@ -255,28 +385,38 @@ async def root():
             "betting": "/api/v1/betting",
             "crypto": "/api/v1/crypto",
             "health": "/health",
+            "ready": "/ready",
             "docs": "/docs"
         }
     }
 
 
 @app.get("/health")
-async def health_check(db: Session = Depends(get_db_session)):
+async def health_check():
     """Health check endpoint"""
     try:
-        # Check database
-        db.execute(text("SELECT 1"))
+        # Check database on a raw async connection — no ORM session, no blocking
+        async with db_manager.async_engine.connect() as conn:
+            await conn.exec_driver_sql("SELECT 1")
         
         return {
             "status": "healthy",
             "database": "connected",
-            "timestamp": "2024-01-01T00:00:00Z"
+            "timestamp": _now_iso()
         }
     except Exception as e:
         logger.error(f"Health check failed: {e}")
         raise HTTPException(status_code=503, detail="Service unhealthy")
 
 
+@app.get("/ready")
+async def readiness_check():
+    """Readiness endpoint — 503 until startup seeding/training completes"""
+    if not model_ready.is_set():
+        raise HTTPException(status_code=503, detail="Model warm-up in progress")
+    return {"status": "ready"}
+
+
 @app.get("/api/v1/system/status")
 async def system_status():
     """Get system status"""
@@ -288,21 +428,26 @@ async def system_status():
             "ml_models": "loaded",
             "integrations": "active"
         },
+        "database_pool": db_manager.pool_status(),
         "version": "1.0.0"
     }
 
 
 if __name__ == "__main__":
+    # Production (imports run once in the master, shared copy-on-write;
+    # size -w as 2 x CPU cores + 1):
+    #   gunicorn src.api.main:app -w $((2 * $(nproc) + 1)) -k uvicorn.workers.UvicornWorker \
+    #       --preload --bind 0.0.0.0:8000 --timeout 120
+    # uvicorn[standard] installs uvloop and httptools; the default
+    # loop="auto"/http="auto" pick them up (plain asyncio/h11 as fallback).
+    # Dev with auto-reload (single worker; reload can't be used with workers):
+    #   RELOAD=1 python -m src.api.main
     import uvicorn
     
-    host = api_config.get('host', '0.0.0.0')
-    port = api_config.get('port', 8000)
-    workers = api_config.get('workers', 4)
-    
     uvicorn.run(
         "src.api.main:app",
-        host=host,
-        port=port,
-        workers=workers,
-        reload=True
+        host=API_HOST,
+        port=API_PORT,
+        workers=1 if RELOAD else API_WORKERS,
+        reload=RELOAD
     )
@@ -1,29 +1,140 @@
 """
 Betting API Routes
 """
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List, Optional
-from pydantic import BaseModel
-from datetime import datetime
-
-from src.database.database import get_db_session
-from src.database.models import Event, Recommendation
+import asyncio
+import zlib
+from bisect import bisect_right
+from itertools import chain
+import orjson
+from functools import lru_cache
+from threading import Lock
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from sqlalchemy import and_, case, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, load_only, selectinload
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from pydantic import BaseModel, ConfigDict
+from datetime import datetime, timedelta
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from src.database.database import (
+    db_manager, get_db_session, get_async_ro_db
+)
+from src.database.models import Event, Odds, Recommendation, Sport
 from src.ml_models.ensemble_predictor import EnsemblePredictor
 from src.ml_models.xgboost_model import XGBoostModel
 from src.recommendation.top3_selector import Top3Selector
+from src.data_ingestion.odds_ingestion_service import add_odds_listener, add_sport_listener
 from src.integrations.polymarket_client import get_polymarket_client
-from src.integrations.sportsbook_links import generate_bet_link, generate_all_book_links
+from src.integrations.sportsbook_links import generate_bet_links_batch, generate_all_book_links
 from src.integrations.polymarket_sports import fetch_polymarket_sports_markets, search_polymarket_markets
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 router = APIRouter()
 
+# Short-lived response caches so polling dashboards don't re-run the
+# selector/ensemble (and re-save recommendations) on every hit
+TOP3_CACHE_TTL = 30
+PREDICT_CACHE_TTL = 30
+PREDICT_CACHE_SIZE = 4096
+_TOP3_CACHE = TTLCache(maxsize=32, ttl=TOP3_CACHE_TTL)
+_PRED_CACHE = TTLCache(maxsize=PREDICT_CACHE_SIZE, ttl=PREDICT_CACHE_TTL)
+_cache_lock = Lock()
+
+
+def invalidate_prediction(event_id: int):
+    """Drop the cached /predict payload for an event (its odds just changed)."""
+    with _cache_lock:
+        _PRED_CACHE.pop(event_id, None)
+
+
+# Predictions depend on current odds, so evict them as soon as new odds land
+add_odds_listener(invalidate_prediction)
+
+# Reference data that only changes on ingestion/retrain: cache server-side
+# and let browsers/CDNs hold it too
+SPORTS_CACHE_TTL = 300
+MODEL_PERF_CACHE_TTL = 60
+REFERENCE_CACHE_CONTROL = {"Cache-Control": f"public, max-age={SPORTS_CACHE_TTL}"}
+# Clients must not hold metrics longer than the server does after a retrain
+MODEL_PERF_CACHE_CONTROL = {"Cache-Control": f"public, max-age={MODEL_PERF_CACHE_TTL}"}
+_SPORTS_CACHE = TTLCache(maxsize=4, ttl=SPORTS_CACHE_TTL)
+_MODEL_PERF_CACHE = TTLCache(maxsize=4, ttl=MODEL_PERF_CACHE_TTL)
+
+
+def clear_reference_caches():
+    """Drop cached /sports and /performance/models payloads (after seeding or retraining)."""
+    with _cache_lock:
+        _SPORTS_CACHE.clear()
+        _MODEL_PERF_CACHE.clear()
+
+
+def clear_sports_cache(sport_name: str = None):
+    """Drop the cached /sports payload (a sport was just created)."""
+    with _cache_lock:
+        _SPORTS_CACHE.clear()
+
+
+# Ingestion (/refresh-odds, the auto-bet loop) can add sports; drop the
+# cached list once a batch that created one is committed. Model metrics
+# don't depend on odds, so they are only cleared on retrain
+add_sport_listener(clear_sports_cache)
+
+
+# In-flight computations by cache key, so concurrent misses on a cold
+# cache share one selector/ensemble run instead of stampeding it
+_inflight: Dict[str, asyncio.Task] = {}
+
+
+async def _singleflight(key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Run `fn()` at most once per key at a time; concurrent callers await the same result.
+
+    Args:
+        key: Identity of the computation (e.g. "top3:soccer")
+        fn: Coroutine function producing the result
+
+    Returns:
+        The shared result
+    """
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(fn())
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    # Shielded so one caller disconnecting doesn't cancel everyone's result
+    return await asyncio.shield(task)
+
+
+def _cache_headers(payload: dict, max_age: int) -> Dict[str, str]:
+    """Let browsers/CDNs dedupe too: ETag tied to the cached payload's timestamp."""
+    stamp = payload.get("generated_at") or payload.get("timestamp", "")
+    return {
+        "ETag": f'"{zlib.crc32(stamp.encode()):08x}"',
+        "Cache-Control": f"max-age={max_age}",
+    }
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header value covers `etag` (list or `*`)."""
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags or f"W/{etag}" in tags
+
 
 # Pydantic models
 class Top3Response(BaseModel):
     """Top 3 recommendations response"""
+    model_config = ConfigDict(frozen=True)
+
     recommendations: List[dict]
     generated_at: str
     time_window_hours: int
@@ -31,6 +142,8 @@ class Top3Response(BaseModel):
 
 class EventResponse(BaseModel):
     """Event response model"""
+    model_config = ConfigDict(frozen=True)
+
     id: int
     name: str
     sport: str
@@ -45,8 +158,15 @@ class PredictionRequest(BaseModel):
     event_id: int
 
 
+class BatchPredictionRequest(BaseModel):
+    """Batch prediction request model"""
+    event_ids: List[int]
+
+
 class PredictionResponse(BaseModel):
     """Prediction response model"""
+    model_config = ConfigDict(frozen=True)
+
     event_id: int
     prediction: dict
     timestamp: str
@@ -79,6 +199,8 @@ class PolymarketConfigRequest(BaseModel):
 
 class PolymarketBalanceResponse(BaseModel):
     """Polymarket balance response model"""
+    model_config = ConfigDict(frozen=True)
+
     connected: bool = False
     balance: Optional[str] = None
     currency: Optional[str] = None
@@ -87,70 +209,101 @@ class PolymarketBalanceResponse(BaseModel):
     raw: Optional[dict] = None
 
 
-# Initialize ensemble predictor (singleton pattern)
-_ensemble_predictor = None
-
 TRAINED_MODEL_PATH = "data/models/xgboost_latest.pkl"
+EVENT_STATUS_UPCOMING = 'upcoming'
+
+
+@lru_cache(maxsize=1)
+def _build_ensemble() -> EnsemblePredictor:
+    """Create the ensemble predictor once, loading the trained model if available."""
+    ensemble = EnsemblePredictor()
+    xgboost_model = XGBoostModel()
+
+    # Load trained model from disk if it exists
+    try:
+        xgboost_model.load_model(TRAINED_MODEL_PATH)
+        logger.info(f"Loaded trained XGBoost model from {TRAINED_MODEL_PATH}")
+    except FileNotFoundError:
+        logger.warning("No trained model found — predictions will use defaults")
+    except Exception as e:
+        logger.warning(f"Failed to load trained model: {e} — using untrained")
+
+    ensemble.register_model('xgboost', xgboost_model)
+    logger.info("Ensemble predictor initialized")
+    return ensemble
 
 
 def get_ensemble_predictor() -> EnsemblePredictor:
-    """Get or create ensemble predictor, loading trained model if available."""
-    global _ensemble_predictor
-    if _ensemble_predictor is None:
-        _ensemble_predictor = EnsemblePredictor()
-        xgboost_model = XGBoostModel()
-
-        # Load trained model from disk if it exists
-        import os
-        if os.path.exists(TRAINED_MODEL_PATH):
-            try:
-                xgboost_model.load_model(TRAINED_MODEL_PATH)
-                logger.info(f"Loaded trained XGBoost model from {TRAINED_MODEL_PATH}")
-            except Exception as e:
-                logger.warning(f"Failed to load trained model: {e} — using untrained")
-        else:
-            logger.warning("No trained model found — predictions will use defaults")
+    """Get the shared ensemble predictor (singleton; reset with _build_ensemble.cache_clear())."""
+    return _build_ensemble()
+
+
+@lru_cache(maxsize=1)
+def _build_top3_selector(ensemble: EnsemblePredictor) -> Top3Selector:
+    """Create the selector once per ensemble instance."""
+    return Top3Selector(ensemble)
+
+
+def get_top3_selector() -> Top3Selector:
+    """Get the shared Top 3 selector, rebuilt automatically when the ensemble is reset."""
+    return _build_top3_selector(get_ensemble_predictor())
 
-        _ensemble_predictor.register_model('xgboost', xgboost_model)
-        logger.info("Ensemble predictor initialized")
-    return _ensemble_predictor
+
+def _select_top3(sport: Optional[str]):
+    """Run the Top 3 selector in its own session; returns (recommendations, time window)."""
+    selector = get_top3_selector()
+    with db_manager.get_session() as db:
+        return selector.get_top3_bets(db, sport=sport), selector.time_window_hours
+
+
+async def _compute_top3(sport: Optional[str], key: str) -> dict:
+    """Build and cache the /top3 payload for one sport key."""
+    logger.info("API request: top3 bets")
+
+    # Selection runs sync DB queries + model inference; keep it off the
+    # event loop. Link enrichment below is pure string work, so it stays inline.
+    recommendations, time_window_hours = await run_in_threadpool(_select_top3, sport)
+
+    # Enrich each recommendation with sportsbook deep links
+    for rec, bet_link in zip(recommendations, generate_bet_links_batch(recommendations)):
+        rec['bet_link'] = bet_link
+
+    payload = {
+        "recommendations": recommendations,
+        "generated_at": datetime.utcnow().isoformat(),
+        "time_window_hours": time_window_hours
+    }
+    with _cache_lock:
+        _TOP3_CACHE[key] = payload
+    return payload
 
 
 @router.get("/top3", response_model=Top3Response)
 async def get_top3_bets(
     sport: Optional[str] = None,
-    db: Session = Depends(get_db_session)
+    if_none_match: Optional[str] = Header(None)
 ):
     """
     Get top 3 betting recommendations for next 24 hours
     
     This endpoint analyzes all upcoming events and returns the 3 most
     promising betting opportunities based on ML predictions and value analysis.
+    Results are cached per sport for TOP3_CACHE_TTL seconds, and concurrent
+    cache misses for the same sport share a single computation.
+    Top3Response documents the shape; the payload is built here, so it is
+    returned as-is without a re-validation pass. A matching If-None-Match
+    gets a bodiless 304.
     """
     try:
-        logger.info("API request: top3 bets")
-        
-        ensemble = get_ensemble_predictor()
-        selector = Top3Selector(ensemble)
-        
-        recommendations = selector.get_top3_bets(db, sport=sport)
-
-        # Enrich each recommendation with sportsbook deep links
-        for rec in recommendations:
-            bet_link = generate_bet_link(
-                bookmaker=rec.get('bookmaker', ''),
-                home_team=rec.get('event_name', '').split(' vs ')[0] if ' vs ' in rec.get('event_name', '') else '',
-                away_team=rec.get('event_name', '').split(' vs ')[-1] if ' vs ' in rec.get('event_name', '') else '',
-                sport=rec.get('sport', ''),
-                event_name=rec.get('event_name', ''),
-            )
-            rec['bet_link'] = bet_link
-
-        return {
-            "recommendations": recommendations,
-            "generated_at": datetime.utcnow().isoformat(),
-            "time_window_hours": selector.time_window_hours
-        }
+        key = sport or "__all__"
+        with _cache_lock:
+            payload = _TOP3_CACHE.get(key)
+        if payload is None:
+            payload = await _singleflight(f"top3:{key}", lambda: _compute_top3(sport, key))
+        headers = _cache_headers(payload, TOP3_CACHE_TTL)
+        if _etag_matches(if_none_match, headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+        return ORJSONResponse(payload, headers=headers)
         
     except Exception as e:
         logger.error(f"Error getting top3 bets: {e}")
@@ -196,14 +349,52 @@ STAKE_TIERS = [
 ]
 
 
+# Tier index = number of tier floors at or below the probability (0 means
+# below the first tier), found with one bisect on the floors instead of a
+# branchy scan over STAKE_TIERS; stake and label are then plain lookups
+_TIER_FLOORS = tuple(low for low, _, _ in STAKE_TIERS)
+_STAKE_BY_TIER = (0.0,) + tuple(amount for _, _, amount in STAKE_TIERS)
+_TIER_LABELS: tuple = (None,) + tuple(
+    f"{int(low*100)}-{int(high*100)}%" for low, high, _ in STAKE_TIERS
+)
+
+
+def _stake_tier_index(probability: float) -> int:
+    """Return the STAKE_TIERS position of a probability, 1-based (0 = below every tier)."""
+    return bisect_right(_TIER_FLOORS, probability)
+
+
 def _tiered_stake(probability: float) -> float:
     """Return the tiered stake amount for a given probability."""
-    for low, high, amount in STAKE_TIERS:
-        if low <= probability < high:
-            return amount
-    if probability >= 1.0:
-        return 22.0
-    return 0.0
+    return _STAKE_BY_TIER[_stake_tier_index(probability)]
+
+
+def _stake_tier_label(probability: float) -> Optional[str]:
+    """Return the tier label for a probability, or None outside the tier ranges."""
+    if probability >= STAKE_TIERS[-1][1]:
+        return None
+    return _TIER_LABELS[_stake_tier_index(probability)]
+
+
+if np is not None:
+    _TIER_FLOORS_ARRAY = np.array(_TIER_FLOORS)
+    _STAKE_TABLE = np.array(_STAKE_BY_TIER)
+
+
+def _tiered_stake_array(probabilities):
+    """
+    Vectorized _tiered_stake for batch/offline risk analysis
+
+    Args:
+        probabilities: Sequence or array of probabilities
+
+    Returns:
+        Array (list without numpy) of stake amounts, same length as input
+    """
+    if np is None:
+        return [_tiered_stake(p) for p in probabilities]
+    tiers = np.searchsorted(_TIER_FLOORS_ARRAY, np.asarray(probabilities, dtype=np.float64), side="right")
+    return _STAKE_TABLE[tiers]
 
 
 @router.post("/direct-bet")
@@ -244,11 +435,7 @@ async def direct_bet(request: DirectBetRequest):
         if not result.get("success"):
             raise HTTPException(status_code=502, detail=result.get("error", "Order rejected by Polymarket"))
 
-        tier_label = f"{int(probability*100)}%"
-        for low, high, _ in STAKE_TIERS:
-            if low <= probability < high:
-                tier_label = f"{int(low*100)}-{int(high*100)}%"
-                break
+        tier_label = _stake_tier_label(probability) or f"{int(probability*100)}%"
 
         return {
             **result,
@@ -315,8 +502,8 @@ async def get_polymarket_balance():
                 "raw": connection
             }
         
-        # Get balance
-        balance = await client.get_balance()
+        # Get balance, reusing the connection check rather than repeating it
+        balance = await client.get_balance(connection=connection)
         
         return {
             "connected": balance.get('connected', False),
@@ -334,156 +521,374 @@ async def get_polymarket_balance():
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Upper bound on user-supplied `limit` for list endpoints
+MAX_LIST_LIMIT = 500
+STREAM_BATCH_SIZE = 200
+
+
+def _clamp_limit(limit: int) -> int:
+    """Keep a user-supplied list limit within [0, MAX_LIST_LIMIT]."""
+    return max(0, min(limit, MAX_LIST_LIMIT))
+
+
+def _iter_json_array(stmt, row_to_dict):
+    """
+    Yield a JSON array of rows as bytes, fetching STREAM_BATCH_SIZE rows at a time.
+
+    Runs in its own session: yield-dependencies are torn down before a
+    streaming body is sent, so the request's session can't be used here.
+    The query executes before the first chunk is yielded.
+    """
+    with db_manager.get_read_session() as db:
+        rows = db.execute(stmt.execution_options(yield_per=STREAM_BATCH_SIZE))
+        yield b"["
+        first = True
+        for row in rows:
+            yield (b"" if first else b",") + orjson.dumps(row_to_dict(row))
+            first = False
+        yield b"]"
+
+
+async def _stream_json_array(stmt, row_to_dict) -> StreamingResponse:
+    """
+    Stream `stmt`'s rows as a JSON array.
+
+    The first chunk is pulled eagerly so connection/query errors still
+    surface as a normal 500 instead of a truncated body.
+    """
+    chunks = _iter_json_array(stmt, row_to_dict)
+    head = await run_in_threadpool(next, chunks)
+    return StreamingResponse(chain([head], chunks), media_type="application/json")
+
+
+def _event_row_to_dict(row) -> dict:
+    return {
+        "id": row.id,
+        "name": row.name,
+        "sport": row.sport or "unknown",
+        "start_time": row.start_time,
+        "status": row.status,
+        "home_team": row.home_team,
+        "away_team": row.away_team
+    }
+
+
 @router.get("/events", response_model=List[EventResponse])
 async def get_upcoming_events(
     sport: Optional[str] = None,
-    limit: int = 50,
-    db: Session = Depends(get_db_session)
+    limit: int = 50
 ):
     """
     Get upcoming events
     
     Args:
         sport: Filter by sport name
-        limit: Maximum number of events to return
+        limit: Maximum number of events to return (capped at MAX_LIST_LIMIT)
     """
     try:
-        query = db.query(Event).filter(
-            Event.status == 'upcoming',
-            Event.start_time >= datetime.utcnow()
+        # Plain columns with the sport name joined in — one query, no ORM
+        # objects — streamed so memory stays flat regardless of `limit`
+        stmt = (
+            select(
+                Event.id, Event.name, Sport.name.label("sport"), Event.start_time,
+                Event.status, Event.home_team, Event.away_team,
+            )
+            .outerjoin(Event.sport)
+            .where(
+                Event.status == EVENT_STATUS_UPCOMING,
+                Event.start_time >= datetime.utcnow()
+            )
         )
         
         if sport:
-            from src.database.models import Sport
-            query = query.join(Event.sport).filter(Sport.name == sport)
-        
-        events = query.order_by(Event.start_time).limit(limit).all()
+            stmt = stmt.where(Sport.name == sport)
         
-        return [
-            {
-                "id": event.id,
-                "name": event.name,
-                "sport": event.sport.name if event.sport else "unknown",
-                "start_time": event.start_time.isoformat(),
-                "status": event.status,
-                "home_team": event.home_team,
-                "away_team": event.away_team
-            }
-            for event in events
-        ]
+        stmt = stmt.order_by(Event.start_time).limit(_clamp_limit(limit))
+        return await _stream_json_array(stmt, _event_row_to_dict)
         
     except Exception as e:
         logger.error(f"Error getting events: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+MAX_BATCH_PREDICT = 500
+
+# Only the Event/Sport columns the prediction features read; skips the
+# JSON metadata blob and bookkeeping columns on every /predict load
+_PREDICTION_EVENT_OPTIONS = (
+    load_only(
+        Event.id, Event.sport_id, Event.name, Event.home_team,
+        Event.away_team, Event.start_time, Event.venue,
+    ),
+    selectinload(Event.sport).load_only(Sport.name),
+)
+
+
+async def _current_odds_by_event(db: AsyncSession, event_ids: List[int]) -> Dict[int, list]:
+    """Current (selection, odds_decimal) rows per event, as projected tuples rather than ORM objects."""
+    rows = (await db.execute(
+        select(Odds.event_id, Odds.selection, Odds.odds_decimal)
+        .where(Odds.event_id.in_(event_ids), Odds.is_current == True)
+        .order_by(Odds.id)
+    )).all()
+    odds_by_event: Dict[int, list] = {}
+    for row in rows:
+        odds_by_event.setdefault(row.event_id, []).append(row)
+    return odds_by_event
+
+
+def _prediction_event_data(event: Event, odds: Optional[list] = None) -> dict:
+    """
+    Build the ensemble input for an event (shared by /predict and /predict/batch)
+
+    With current odds, features are derived from the market exactly as
+    Top3Selector does; without them, neutral default odds are used.
+    """
+    if odds:
+        return get_top3_selector()._prepare_event_data(event, odds)
+    return {
+        'event_id': event.id,
+        'event_name': event.name,
+        'sport': event.sport.name if event.sport else 'unknown',
+        'home_team': event.home_team,
+        'away_team': event.away_team,
+        'home_odds': 2.0,
+        'away_odds': 2.0,
+        'draw_odds': 3.0
+    }
+
+
+def _prediction_payload(event_id: int, prediction: dict, timestamp: str) -> dict:
+    """Validate a /predict payload once, when it enters the cache, rather than on every hit."""
+    return PredictionResponse(
+        event_id=event_id, prediction=prediction, timestamp=timestamp
+    ).model_dump()
+
+
+async def _compute_prediction(event_id: int) -> dict:
+    """Predict one event in its own read session and cache the payload."""
+    async with db_manager.get_async_read_session() as db:
+        event = (await db.execute(
+            select(Event).options(*_PREDICTION_EVENT_OPTIONS).where(Event.id == event_id)
+        )).scalar_one_or_none()
+        odds = (await _current_odds_by_event(db, [event_id])).get(event_id) if event else None
+    
+    if not event:
+        raise HTTPException(status_code=404, detail="Event not found")
+    
+    # Model inference is CPU work (XGBoost releases the GIL); keep it off the event loop
+    ensemble = get_ensemble_predictor()
+    prediction = await run_in_threadpool(ensemble.predict, _prediction_event_data(event, odds))
+    
+    payload = _prediction_payload(event.id, prediction, datetime.utcnow().isoformat())
+    with _cache_lock:
+        _PRED_CACHE[event_id] = payload
+    return payload
+
+
 @router.post("/predict", response_model=PredictionResponse)
-async def predict_event(
-    request: PredictionRequest,
-    db: Session = Depends(get_db_session)
-):
+async def predict_event(request: PredictionRequest):
     """
     Get prediction for a specific event
     
     Args:
         request: Prediction request with event_id
+
+    Predictions are cached per event for PREDICT_CACHE_TTL seconds (or until
+    new odds are ingested for the event), and concurrent cache misses for
+    the same event share a single computation. Payloads are validated
+    against PredictionResponse when cached, so hits are returned as-is.
     """
     try:
-        # Get event
-        event = db.query(Event).filter(Event.id == request.event_id).first()
-        
-        if not event:
-            raise HTTPException(status_code=404, detail="Event not found")
-        
-        # Get odds
-        from src.database.models import Odds
-        odds = db.query(Odds).filter(
-            Odds.event_id == event.id,
-            Odds.is_current == True
-        ).all()
-        
-        # Prepare event data
-        event_data = {
-            'event_id': event.id,
-            'event_name': event.name,
-            'sport': event.sport.name if event.sport else 'unknown',
-            'home_team': event.home_team,
-            'away_team': event.away_team,
-            'home_odds': 2.0,
-            'away_odds': 2.0,
-            'draw_odds': 3.0
-        }
-        
-        # Get prediction
-        ensemble = get_ensemble_predictor()
-        prediction = ensemble.predict(event_data)
+        with _cache_lock:
+            payload = _PRED_CACHE.get(request.event_id)
+        if payload is None:
+            payload = await _singleflight(
+                f"predict:{request.event_id}", lambda: _compute_prediction(request.event_id)
+            )
+        return ORJSONResponse(payload)
         
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error predicting event: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/predict/batch")
+async def predict_events_batch(
+    request: BatchPredictionRequest,
+    db: AsyncSession = Depends(get_async_ro_db)
+):
+    """
+    Get predictions for many events in one round-trip
+    
+    Args:
+        request: Batch request with event_ids (up to MAX_BATCH_PREDICT)
+    
+    Returns:
+        Predictions keyed by event_id, plus any ids that were not found
+    """
+    try:
+        # One timestamp for the response and every cache entry it fills
+        now_iso = datetime.utcnow().isoformat()
+        event_ids = list(dict.fromkeys(request.event_ids))
+        if len(event_ids) > MAX_BATCH_PREDICT:
+            raise HTTPException(
+                status_code=400,
+                detail=f"At most {MAX_BATCH_PREDICT} event_ids per batch",
+            )
+
+        # Serve what we can from the per-event /predict cache
+        predictions = {}
+        with _cache_lock:
+            for event_id in event_ids:
+                cached = _PRED_CACHE.get(event_id)
+                if cached is not None:
+                    predictions[event_id] = cached["prediction"]
+        missing = [event_id for event_id in event_ids if event_id not in predictions]
+
+        if missing:
+            # One IN query for all uncached events
+            events = (await db.execute(
+                select(Event).options(*_PREDICTION_EVENT_OPTIONS).where(Event.id.in_(missing))
+            )).scalars().all()
+            odds_by_event = await _current_odds_by_event(db, [e.id for e in events]) if events else {}
+            ensemble = get_ensemble_predictor()
+            results = await run_in_threadpool(ensemble.batch_predict, [
+                _prediction_event_data(e, odds_by_event.get(e.id)) for e in events
+            ])
+
+            with _cache_lock:
+                for event, prediction in zip(events, results):
+                    predictions[event.id] = prediction
+                    _PRED_CACHE[event.id] = _prediction_payload(event.id, prediction, now_iso)
+
         return {
-            "event_id": event.id,
-            "prediction": prediction,
-            "timestamp": datetime.utcnow().isoformat()
+            "predictions": {event_id: predictions[event_id] for event_id in event_ids if event_id in predictions},
+            "not_found": [event_id for event_id in event_ids if event_id not in predictions],
+            "timestamp": now_iso
         }
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error predicting event: {e}")
+        logger.error(f"Error predicting events batch: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+_HISTORY_COLUMNS = (
+    Recommendation.id,
+    Recommendation.event_id,
+    Recommendation.selection,
+    Recommendation.recommended_odds,
+    Recommendation.confidence_score,
+    Recommendation.expected_value,
+    Recommendation.status,
+    Recommendation.actual_outcome,
+    Recommendation.actual_return,
+    Recommendation.created_at,
+)
+
+
+def _history_row_to_dict(row) -> dict:
+    return {
+        "id": row.id,
+        "event_id": row.event_id,
+        "selection": row.selection,
+        "recommended_odds": row.recommended_odds,
+        "confidence_score": row.confidence_score,
+        "expected_value": row.expected_value,
+        "status": row.status,
+        "actual_outcome": row.actual_outcome,
+        "actual_return": row.actual_return,
+        "created_at": row.created_at
+    }
+
+
 @router.get("/recommendations/history")
 async def get_recommendation_history(
     limit: int = 50,
-    db: Session = Depends(get_db_session)
+    before: Optional[datetime] = None,
+    before_id: Optional[int] = None,
+    db: AsyncSession = Depends(get_async_ro_db)
 ):
     """
-    Get historical recommendations
+    Get historical recommendations, newest first
     
     Args:
-        limit: Maximum number of recommendations to return
+        limit: Maximum number of recommendations to return (capped at MAX_LIST_LIMIT)
+        before: Keyset cursor — only return recommendations created before this time
+        before_id: Tie-breaker for `before` (rows at exactly `before` with a lower id)
+
+    When a full page is returned, the cursor for the next page is sent in
+    the X-Next-Cursor and X-Next-Cursor-Id headers.
     """
     try:
-        recommendations = db.query(Recommendation).order_by(
-            Recommendation.created_at.desc()
-        ).limit(limit).all()
-        
-        return [
-            {
-                "id": rec.id,
-                "event_id": rec.event_id,
-                "selection": rec.selection,
-                "recommended_odds": rec.recommended_odds,
-                "confidence_score": rec.confidence_score,
-                "expected_value": rec.expected_value,
-                "status": rec.status,
-                "actual_outcome": rec.actual_outcome,
-                "actual_return": rec.actual_return,
-                "created_at": rec.created_at.isoformat()
-            }
-            for rec in recommendations
-        ]
+        limit = _clamp_limit(limit)
+
+        # Plain column tuples — no ORM hydration for this read-only listing
+        stmt = select(*_HISTORY_COLUMNS)
+        if before is not None:
+            if before_id is not None:
+                stmt = stmt.where(or_(
+                    Recommendation.created_at < before,
+                    and_(Recommendation.created_at == before, Recommendation.id < before_id),
+                ))
+            else:
+                stmt = stmt.where(Recommendation.created_at < before)
+        stmt = stmt.order_by(Recommendation.created_at.desc(), Recommendation.id.desc())
+
+        # One bounded query: the body and the next cursor come from the same
+        # rows, so a row inserted mid-request can't shift the page past it
+        rows = (await db.execute(stmt.limit(limit))).all() if limit else []
+        headers = {}
+        if rows and len(rows) == limit:
+            headers["X-Next-Cursor"] = rows[-1].created_at.isoformat()
+            headers["X-Next-Cursor-Id"] = str(rows[-1].id)
+
+        body = orjson.dumps([_history_row_to_dict(row) for row in rows])
+        return Response(content=body, media_type="application/json", headers=headers)
         
     except Exception as e:
         logger.error(f"Error getting recommendation history: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def _load_sports_json() -> bytes:
+    """Serialize the active sports list in its own read session and cache the bytes."""
+    async with db_manager.get_async_read_session() as db:
+        sports = (await db.execute(
+            select(Sport.id, Sport.name, Sport.category).where(Sport.is_active == True)
+        )).all()
+    body = orjson.dumps([
+        {
+            "id": sport.id,
+            "name": sport.name,
+            "category": sport.category
+        }
+        for sport in sports
+    ])
+    with _cache_lock:
+        _SPORTS_CACHE["active"] = body
+    return body
+
+
 @router.get("/sports")
-async def get_available_sports(db: Session = Depends(get_db_session)):
-    """Get list of available sports"""
+async def get_available_sports():
+    """
+    Get list of available sports (cached for SPORTS_CACHE_TTL seconds)
+    
+    Cache hits are served as pre-serialized bytes without opening a
+    database session; concurrent misses share one query.
+    """
     try:
-        from src.database.models import Sport
-        
-        sports = db.query(Sport).filter(Sport.is_active == True).all()
+        with _cache_lock:
+            body = _SPORTS_CACHE.get("active")
+        if body is None:
+            body = await _singleflight("sports", _load_sports_json)
         
-        return [
-            {
-                "id": sport.id,
-                "name": sport.name,
-                "category": sport.category
-            }
-            for sport in sports
-        ]
+        return Response(content=body, media_type="application/json", headers=REFERENCE_CACHE_CONTROL)
         
     except Exception as e:
         logger.error(f"Error getting sports: {e}")
@@ -492,15 +897,23 @@ async def get_available_sports(db: Session = Depends(get_db_session)):
 
 @router.get("/performance/models")
 async def get_model_performance():
-    """Get ML model performance metrics"""
+    """Get ML model performance metrics (cached as serialized bytes for MODEL_PERF_CACHE_TTL seconds)"""
     try:
-        ensemble = get_ensemble_predictor()
-        performance = ensemble.get_model_performance()
+        with _cache_lock:
+            body = _MODEL_PERF_CACHE.get("models")
+        if body is None:
+            ensemble = get_ensemble_predictor()
+            performance = ensemble.get_model_performance()
+            
+            # Same encoding as ORJSONResponse (model params may hold numpy values)
+            body = orjson.dumps({
+                "models": performance,
+                "timestamp": datetime.utcnow()
+            }, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+            with _cache_lock:
+                _MODEL_PERF_CACHE["models"] = body
         
-        return {
-            "models": performance,
-            "timestamp": datetime.utcnow().isoformat()
-        }
+        return Response(content=body, media_type="application/json", headers=MODEL_PERF_CACHE_CONTROL)
         
     except Exception as e:
         logger.error(f"Error getting model performance: {e}")
@@ -508,23 +921,33 @@ async def get_model_performance():
 
 
 @router.get("/stats/summary")
-async def get_betting_stats(db: Session = Depends(get_db_session)):
-    """Get betting statistics summary"""
+async def get_betting_stats(
+    days: Optional[int] = None,
+    db: AsyncSession = Depends(get_async_ro_db)
+):
+    """
+    Get betting statistics summary
+    
+    Args:
+        days: Only count recommendations from the last N days, bounding
+            the scan to a created_at range (all time when omitted)
+    """
     try:
-        # Get recommendation stats
-        total_recommendations = db.query(Recommendation).count()
-        
-        won_bets = db.query(Recommendation).filter(
-            Recommendation.status == 'won'
-        ).count()
-        
-        lost_bets = db.query(Recommendation).filter(
-            Recommendation.status == 'lost'
-        ).count()
-        
-        pending_bets = db.query(Recommendation).filter(
-            Recommendation.status == 'pending'
-        ).count()
+        # Get recommendation stats in one scan: total plus per-status counts
+        def _status_count(status: str):
+            return func.sum(case((Recommendation.status == status, 1), else_=0))
+
+        stmt = select(
+            func.count(Recommendation.id),
+            _status_count('won'),
+            _status_count('lost'),
+            _status_count('pending'),
+        )
+        if days is not None:
+            stmt = stmt.where(Recommendation.created_at >= datetime.utcnow() - timedelta(days=days))
+        total_recommendations, won_bets, lost_bets, pending_bets = (await db.execute(stmt)).one()
+        # SUM over an empty table is NULL
+        won_bets, lost_bets, pending_bets = won_bets or 0, lost_bets or 0, pending_bets or 0
         
         # Calculate win rate
         completed_bets = won_bets + lost_bets
@@ -536,7 +959,7 @@ async def get_betting_stats(db: Session = Depends(get_db_session)):
             "lost_bets": lost_bets,
             "pending_bets": pending_bets,
             "win_rate": round(win_rate, 2),
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": datetime.utcnow()
         }
         
     except Exception as e:
@@ -552,14 +975,14 @@ async def get_polymarket_sports_markets(query: Optional[str] = None):
     """
     try:
         if query:
-            markets = search_polymarket_markets(query)
+            markets = await search_polymarket_markets(query)
         else:
-            markets = fetch_polymarket_sports_markets()
+            markets = await fetch_polymarket_sports_markets()
         return {
             "markets": markets,
             "count": len(markets),
             "source": "polymarket",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.utcnow(),
         }
     except Exception as e:
         logger.error(f"Error fetching Polymarket markets: {e}")
@@ -571,20 +994,18 @@ async def refresh_odds():
     """Trigger a live odds refresh from The Odds API"""
     try:
         from src.data_ingestion.odds_ingestion_service import OddsIngestionService
-        from src.database.models import Event
 
         service = OddsIngestionService()
         await service.fetch_and_store_odds()
 
-        from src.database.database import db_manager
-        with db_manager.get_session() as db:
-            event_count = db.query(Event).count()
+        async with db_manager.get_async_read_session() as db:
+            event_count = (await db.execute(select(func.count()).select_from(Event))).scalar_one()
 
         return {
             "success": True,
             "message": f"Live odds refreshed — {event_count} events in database",
             "event_count": event_count,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.utcnow(),
         }
     except Exception as e:
         logger.error(f"Error refreshing odds: {e}")
@@ -593,35 +1014,68 @@ async def refresh_odds():
 
 # ─────────────────── Ledger endpoints ───────────────────
 
+def _iter_ledger_ndjson(limit: int, status: Optional[str]):
+    """
+    Yield ledger entries as NDJSON lines from a dedicated read session.
+
+    The session stays open (and in its READ ONLY transaction on PostgreSQL)
+    until the last line is sent, which iter_ledger's server-side cursor
+    needs. The first chunk is produced once the query has run (empty if there are
+    no entries), so _stream-style callers can pull it eagerly.
+    """
+    from src.services.auto_bet_service import iter_ledger
+
+    with db_manager.get_read_session() as db:
+        entries = iter_ledger(db, limit=limit, status_filter=status)
+        first = next(entries, None)
+        yield b"" if first is None else orjson.dumps(first) + b"\n"
+        for entry in entries:
+            yield orjson.dumps(entry) + b"\n"
+
+
 @router.get("/ledger")
 async def get_ledger(
     limit: int = 100,
     status: Optional[str] = None,
-    db: Session = Depends(get_db_session),
+    format: str = "ndjson",
+    db: AsyncSession = Depends(get_async_ro_db),
 ):
-    """Return the bet ledger (recorded & graded bets)."""
+    """
+    Return the bet ledger (recorded & graded bets)
+
+    Entries are streamed as NDJSON (one entry per line) by default;
+    `format=json` returns the `{entries, count, timestamp}` object instead.
+    """
     try:
-        from src.services.auto_bet_service import get_ledger as _get_ledger
-        entries = _get_ledger(db, limit=limit, status_filter=status)
-        return {
-            "entries": entries,
-            "count": len(entries),
-            "timestamp": datetime.utcnow().isoformat(),
-        }
+        if format == "json":
+            from src.services.auto_bet_service import get_ledger as _get_ledger
+            entries = await db.run_sync(_get_ledger, limit=limit, status_filter=status)
+            return {
+                "entries": entries,
+                "count": len(entries),
+                "timestamp": datetime.utcnow(),
+            }
+
+        # Pull the first line eagerly so query errors still return a 500
+        chunks = _iter_ledger_ndjson(limit, status)
+        head = await run_in_threadpool(next, chunks)
+        return StreamingResponse(chain([head], chunks), media_type="application/x-ndjson")
     except Exception as e:
         logger.error(f"Error fetching ledger: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/ledger/stats")
-async def get_ledger_stats(db: Session = Depends(get_db_session)):
+async def get_ledger_stats(db: AsyncSession = Depends(get_async_ro_db)):
     """Return aggregate P&L stats from the ledger."""
     try:
         from src.services.auto_bet_service import get_ledger_summary
-        summary = get_ledger_summary(db)
+        # The service's sync query code runs on the async driver, inside the
+        # session's READ ONLY transaction (_get_streak reads via yield_per)
+        summary = await db.run_sync(get_ledger_summary)
         return {
             **summary,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.utcnow(),
         }
     except Exception as e:
         logger.error(f"Error fetching ledger stats: {e}")
@@ -633,12 +1087,12 @@ async def trigger_auto_bet(db: Session = Depends(get_db_session)):
     """Manually trigger one auto-bet cycle (find bets + record)."""
     try:
         from src.services.auto_bet_service import record_top3_bets
-        recorded = record_top3_bets(db)
+        recorded = await run_in_threadpool(record_top3_bets, db)
         return {
             "success": True,
             "recorded": len(recorded),
             "bets": recorded,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.utcnow(),
         }
     except Exception as e:
         logger.error(f"Error triggering auto-bet: {e}")
@@ -654,7 +1108,7 @@ async def trigger_grade():
         return {
             "success": True,
             **result,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.utcnow(),
         }
     except Exception as e:
         logger.error(f"Error grading bets: {e}")
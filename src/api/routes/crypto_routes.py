@@ -1,14 +1,18 @@
 """
 Cryptocurrency API Routes
 """
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from functools import lru_cache
+import orjson
+from fastapi import APIRouter, HTTPException, Response
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
 
 try:
-    from src.integrations.crypto_wallet import get_crypto_wallet
+    from src.integrations.crypto_wallet import get_crypto_wallet, reset_crypto_wallet
 except ImportError:
     get_crypto_wallet = None
+    reset_crypto_wallet = None
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -23,6 +27,8 @@ class BalanceRequest(BaseModel):
 
 class BalanceResponse(BaseModel):
     """Balance response model"""
+    model_config = ConfigDict(frozen=True)
+
     token: str
     balance: float
     address: str
@@ -39,6 +45,8 @@ class TransactionRequest(BaseModel):
 
 class TransactionResponse(BaseModel):
     """Transaction response model"""
+    model_config = ConfigDict(frozen=True)
+
     success: bool
     transaction_hash: Optional[str]
     from_address: Optional[str]
@@ -76,8 +84,9 @@ async def get_balance(request: BalanceRequest):
     try:
         logger.info(f"API request: get balance for {request.token_symbol}")
         
-        wallet = get_crypto_wallet()
-        balance_info = wallet.get_balance(request.token_symbol)
+        # web3 calls are blocking RPC round-trips; keep them off the event loop
+        wallet = await run_in_threadpool(get_crypto_wallet)
+        balance_info = await run_in_threadpool(wallet.get_balance, request.token_symbol)
         
         if 'error' in balance_info:
             raise HTTPException(status_code=400, detail=balance_info['error'])
@@ -109,8 +118,9 @@ async def send_transaction(request: TransactionRequest):
     try:
         logger.info(f"API request: send {request.amount} {request.token_symbol} to {request.to_address}")
         
-        wallet = get_crypto_wallet()
-        result = wallet.send_transaction(
+        wallet = await run_in_threadpool(get_crypto_wallet)
+        result = await run_in_threadpool(
+            wallet.send_transaction,
             to_address=request.to_address,
             amount=request.amount,
             token_symbol=request.token_symbol,
@@ -146,8 +156,8 @@ async def get_transaction_status(request: TransactionStatusRequest):
     try:
         logger.info(f"API request: get transaction status for {request.transaction_hash}")
         
-        wallet = get_crypto_wallet()
-        status = wallet.get_transaction_status(request.transaction_hash)
+        wallet = await run_in_threadpool(get_crypto_wallet)
+        status = await run_in_threadpool(wallet.get_transaction_status, request.transaction_hash)
         
         if 'error' in status:
             raise HTTPException(status_code=400, detail=status['error'])
@@ -175,8 +185,9 @@ async def estimate_gas(request: GasEstimateRequest):
     try:
         logger.info(f"API request: estimate gas for {request.amount} {request.token_symbol}")
         
-        wallet = get_crypto_wallet()
-        estimate = wallet.estimate_gas(
+        wallet = await run_in_threadpool(get_crypto_wallet)
+        estimate = await run_in_threadpool(
+            wallet.estimate_gas,
             to_address=request.to_address,
             amount=request.amount,
             token_symbol=request.token_symbol
@@ -194,6 +205,52 @@ async def estimate_gas(request: GasEstimateRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@lru_cache(maxsize=1)
+def _wallet_info_json() -> bytes:
+    """Serialized /wallet/info body; the wallet's address and config are fixed per process."""
+    wallet = get_crypto_wallet()
+    return orjson.dumps({
+        "address": wallet.wallet_address,
+        "network": "Binance Smart Chain",
+        "supported_tokens": list(wallet.supported_tokens.keys()),
+        "rpc_url": wallet.rpc_url
+    })
+
+
+@lru_cache(maxsize=1)
+def _supported_tokens_json() -> bytes:
+    """Serialized /tokens body, built once from the wallet's token config."""
+    wallet = get_crypto_wallet()
+    
+    tokens = []
+    for symbol, info in wallet.supported_tokens.items():
+        tokens.append({
+            "symbol": symbol,
+            "contract": info.get('contract'),
+            "network": "BSC"
+        })
+    
+    return orjson.dumps({"tokens": tokens})
+
+
+def refresh_wallet():
+    """Drop the wallet (closing its RPC pool) and its cached response bodies; rebuilt on next use."""
+    if reset_crypto_wallet is not None:
+        reset_crypto_wallet()
+    _wallet_info_json.cache_clear()
+    _supported_tokens_json.cache_clear()
+
+
+def warm_wallet_caches():
+    """Build the wallet and its static response bodies ahead of the first request."""
+    try:
+        _wallet_info_json()
+        _supported_tokens_json()
+        logger.info("Wallet info and token list cached")
+    except Exception as e:
+        logger.warning(f"Wallet warm-up failed: {e}")
+
+
 @router.get("/wallet/info")
 async def get_wallet_info():
     """
@@ -203,14 +260,9 @@ async def get_wallet_info():
         Wallet address and supported tokens
     """
     try:
-        wallet = get_crypto_wallet()
-        
-        return {
-            "address": wallet.wallet_address,
-            "network": "Binance Smart Chain",
-            "supported_tokens": list(wallet.supported_tokens.keys()),
-            "rpc_url": wallet.rpc_url
-        }
+        # First call builds the wallet (an RPC connection check)
+        body = await run_in_threadpool(_wallet_info_json)
+        return Response(content=body, media_type="application/json")
         
     except Exception as e:
         logger.error(f"Error getting wallet info: {e}")
@@ -226,17 +278,8 @@ async def get_supported_tokens():
         List of supported cryptocurrency tokens
     """
     try:
-        wallet = get_crypto_wallet()
-        
-        tokens = []
-        for symbol, info in wallet.supported_tokens.items():
-            tokens.append({
-                "symbol": symbol,
-                "contract": info.get('contract'),
-                "network": "BSC"
-            })
-        
-        return {"tokens": tokens}
+        body = await run_in_threadpool(_supported_tokens_json)
+        return Response(content=body, media_type="application/json")
         
     except Exception as e:
         logger.error(f"Error getting supported tokens: {e}")
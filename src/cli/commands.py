@@ -3,27 +3,150 @@ CLI Commands for Betting AI System
 """
 import asyncio
 import click
-from rich.console import Console
+from contextlib import contextmanager
+from functools import lru_cache
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
 from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Optional
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
-from src.database.database import db_manager
-from src.ml_models.ensemble_predictor import EnsemblePredictor
-from src.ml_models.xgboost_model import XGBoostModel
-from src.recommendation.top3_selector import Top3Selector
-from src.integrations.stake_client import get_stake_client
-from src.integrations.crypto_wallet import get_crypto_wallet
+from src.database.database import db_manager, insert_ignore
 from src.utils.logger import get_logger
 
+# ML and wallet modules (numpy/xgboost/web3) are imported inside the
+# commands that use them, so other commands start without loading them
+if TYPE_CHECKING:
+    from src.ml_models.ensemble_predictor import EnsemblePredictor
+    from src.recommendation.top3_selector import Top3Selector
+
 logger = get_logger(__name__)
 console = Console()
 
+# Written by train_model.py (and by the API's startup training)
+TRAINED_MODEL_PATH = "data/models/xgboost_latest.pkl"
+
+
+@lru_cache(maxsize=1)
+def _get_ensemble() -> "EnsemblePredictor":
+    """Build the ensemble once per process, loading the trained model if available."""
+    from src.ml_models.ensemble_predictor import EnsemblePredictor
+    from src.ml_models.xgboost_model import XGBoostModel
+    
+    ensemble = EnsemblePredictor()
+    xgboost_model = XGBoostModel()
+    try:
+        xgboost_model.load_model(TRAINED_MODEL_PATH)
+    except FileNotFoundError:
+        logger.warning("No trained model found — predictions will use defaults")
+    except Exception as e:
+        logger.warning(f"Failed to load trained model: {e} — using untrained")
+    ensemble.register_model('xgboost', xgboost_model)
+    return ensemble
+
+
+@lru_cache(maxsize=1)
+def _get_selector() -> "Top3Selector":
+    """Top3Selector over the shared ensemble."""
+    from src.recommendation.top3_selector import Top3Selector
+    
+    return Top3Selector(_get_ensemble())
+
+
+# One event loop per CLI process: the Odds API client keeps a pooled
+# httpx.AsyncClient whose connections are tied to the loop that opened them
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _run(coro):
+    """
+    Run a coroutine to completion on the shared CLI event loop
+    
+    Args:
+        coro: Coroutine to run
+    
+    Returns:
+        The coroutine's result
+    """
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+        asyncio.set_event_loop(_loop)
+    return _loop.run_until_complete(coro)
+
 
-@click.group()
+@contextmanager
+def _session():
+    """
+    Database session for a CLI command
+    
+    Chained commands (``cli init-db seed-demo top3-bets``) share one session,
+    opened on first use and closed with the CLI context, so the connection is
+    checked out once per invocation. Each command still commits its own work.
+    
+    Yields:
+        Database session
+    """
+    ctx = click.get_current_context(silent=True)
+    if ctx is None:
+        with db_manager.get_session() as db:
+            yield db
+        return
+    
+    root = ctx.find_root()
+    db = root.meta.get('db')
+    if db is None:
+        # Bound to one connection, so commits between commands keep it checked out
+        connection = root.with_resource(db_manager.engine.connect())
+        db = root.meta['db'] = root.with_resource(db_manager.SessionLocal(bind=connection))
+    try:
+        yield db
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+
+def _has_upcoming_events() -> bool:
+    """
+    Check whether any event falls in the recommendation time window, using
+    the same window and filters as Top3Selector without loading the models
+    
+    Returns:
+        True if at least one upcoming event is in the window
+    """
+    from sqlalchemy import exists, select
+    from src.database.models import Event
+    from src.utils.config_loader import get_config
+    
+    top3_cfg = get_config().get_recommendation_config().get('top3_selection', {})
+    try:
+        window_hours = int(float(top3_cfg.get('time_window_hours', 168)))
+    except (TypeError, ValueError):
+        window_hours = 168
+    
+    now = datetime.utcnow()
+    with _session() as db:
+        return db.execute(select(exists().where(
+            Event.start_time >= now,
+            Event.start_time <= now + timedelta(hours=window_hours),
+            Event.status == 'upcoming'
+        ))).scalar()
+
+
+@click.group(chain=True)
 def cli():
-    """Betting AI System CLI"""
+    """
+    Betting AI System CLI
+    
+    Several commands can be run in one invocation, sharing a database
+    session, e.g. ``cli init-db seed-demo top3-bets``.
+    """
     pass
 
 
@@ -38,129 +161,131 @@ def top3_bets():
     console.print("\n[bold cyan]🎯 Analyzing Betting Opportunities...[/bold cyan]\n")
     
     try:
+        # Skip loading the models entirely when there is nothing to score
+        if not _has_upcoming_events():
+            console.print("[red]No betting opportunities found meeting criteria.[/red]")
+            return
+        
         # Initialize components
         console.print("[yellow]Initializing ML models...[/yellow]")
-        ensemble = EnsemblePredictor()
-        xgboost_model = XGBoostModel()
-        ensemble.register_model('xgboost', xgboost_model)
+        selector = _get_selector()
         
         console.print("[yellow]Connecting to database...[/yellow]")
         
         # Get recommendations
-        with db_manager.get_session() as db:
-            selector = Top3Selector(ensemble)
+        with _session() as db:
             recommendations = selector.get_top3_bets(db)
         
         if not recommendations:
             console.print("[red]No betting opportunities found meeting criteria.[/red]")
             return
         
-        # Display recommendations
-        console.print(f"\n[bold green]✅ Top 3 Betting Recommendations (Next 24 Hours)[/bold green]\n")
-        
+        # Display recommendations and summary as one render/write
+        renderables = [
+            console.render_str("\n[bold green]✅ Top 3 Betting Recommendations (Next 24 Hours)[/bold green]\n")
+        ]
         for i, rec in enumerate(recommendations, 1):
-            _display_recommendation(rec, i)
-        
-        # Summary
-        _display_summary(recommendations)
+            renderables += [_build_recommendation_panel(rec, i), Text()]
+        renderables.append(_build_summary(recommendations))
+        console.print(Group(*renderables))
         
     except Exception as e:
         console.print(f"[bold red]Error: {e}[/bold red]")
         logger.error(f"Error in top3_bets command: {e}")
 
 
-def _display_recommendation(rec: dict, rank: int):
-    """Display a single recommendation"""
+def _build_recommendation_panel(rec: dict, rank: int) -> Panel:
+    """Build the panel for a single recommendation"""
     
     # Create recommendation panel
     title = f"🏆 Rank #{rank}: {rec['event_name']}"
     
-    # Build content
-    content = Text()
-    content.append(f"Sport: ", style="bold")
-    content.append(f"{rec['sport']}\n", style="cyan")
-    
-    content.append(f"Match Time: ", style="bold")
-    content.append(f"{rec['start_time']}\n\n", style="yellow")
-    
-    content.append(f"Recommended Bet: ", style="bold green")
-    content.append(f"{rec['selection']} @ {rec['recommended_odds']}\n", style="green")
-    
-    content.append(f"Bookmaker: ", style="bold")
-    content.append(f"{rec['bookmaker']}\n\n", style="white")
-    
-    # Metrics
-    content.append("📊 Metrics:\n", style="bold cyan")
-    content.append(f"  • Confidence Score: ", style="bold")
-    content.append(f"{rec['confidence_score']:.1f}%\n", style="green" if rec['confidence_score'] > 70 else "yellow")
-    
-    content.append(f"  • Expected Value: ", style="bold")
+    # Conditional colours, decided up front
+    confidence_style = "green" if rec['confidence_score'] > 70 else "yellow"
+    risk_style = "yellow" if rec['risk_score'] < 0.5 else "red"
     ev_pct = rec['expected_value'] * 100
-    content.append(f"+{ev_pct:.2f}%\n", style="green")
-    
-    content.append(f"  • Win Probability: ", style="bold")
-    content.append(f"{rec['probability']*100:.1f}%\n", style="cyan")
-    
-    content.append(f"  • Risk Score: ", style="bold")
-    content.append(f"{rec['risk_score']:.2f}\n\n", style="yellow" if rec['risk_score'] < 0.5 else "red")
-    
-    # Stake recommendation
-    content.append("💰 Stake Recommendation:\n", style="bold magenta")
-    content.append(f"  • Amount: ", style="bold")
-    content.append(f"${rec['recommended_stake']:.2f}\n", style="green")
-    content.append(f"  • Percentage: ", style="bold")
-    content.append(f"{rec['recommended_stake_percentage']:.2f}% of bankroll\n\n", style="green")
-    
-    # Rationale
     rationale = rec.get('rationale', {})
-    content.append("📝 Analysis:\n", style="bold blue")
-    content.append(f"{rationale.get('summary', 'N/A')}\n\n", style="white")
+    
+    # Build content as (text, style) parts assembled in one pass; plain
+    # parts (not markup) so event/team names are never parsed as tags
+    parts = [
+        ("Sport: ", "bold"), (f"{rec['sport']}\n", "cyan"),
+        ("Match Time: ", "bold"), (f"{rec['start_time']}\n\n", "yellow"),
+        ("Recommended Bet: ", "bold green"), (f"{rec['selection']} @ {rec['recommended_odds']}\n", "green"),
+        ("Bookmaker: ", "bold"), (f"{rec['bookmaker']}\n\n", "white"),
+        
+        # Metrics
+        ("📊 Metrics:\n", "bold cyan"),
+        ("  • Confidence Score: ", "bold"), (f"{rec['confidence_score']:.1f}%\n", confidence_style),
+        ("  • Expected Value: ", "bold"), (f"+{ev_pct:.2f}%\n", "green"),
+        ("  • Win Probability: ", "bold"), (f"{rec['probability']*100:.1f}%\n", "cyan"),
+        ("  • Risk Score: ", "bold"), (f"{rec['risk_score']:.2f}\n\n", risk_style),
+        
+        # Stake recommendation
+        ("💰 Stake Recommendation:\n", "bold magenta"),
+        ("  • Amount: ", "bold"), (f"${rec['recommended_stake']:.2f}\n", "green"),
+        ("  • Percentage: ", "bold"), (f"{rec['recommended_stake_percentage']:.2f}% of bankroll\n\n", "green"),
+        
+        # Rationale
+        ("📝 Analysis:\n", "bold blue"),
+        (f"{rationale.get('summary', 'N/A')}\n\n", "white"),
+    ]
     
     if 'key_reasons' in rationale:
-        content.append("Key Reasons:\n", style="bold")
-        for reason in rationale['key_reasons']:
-            content.append(f"  ✓ {reason}\n", style="green")
+        parts.append(("Key Reasons:\n", "bold"))
+        parts.extend((f"  ✓ {reason}\n", "green") for reason in rationale['key_reasons'])
     
     # Value analysis
     if 'value_analysis' in rationale:
         va = rationale['value_analysis']
-        content.append(f"\n💎 Value Analysis:\n", style="bold yellow")
-        content.append(f"  • Edge vs Market: {va.get('edge', 'N/A')}\n", style="cyan")
-        content.append(f"  • Model Probability: {va.get('model_probability', 'N/A')}\n", style="cyan")
-        content.append(f"  • Implied Probability: {va.get('implied_probability', 'N/A')}\n", style="cyan")
+        parts += [
+            ("\n💎 Value Analysis:\n", "bold yellow"),
+            (f"  • Edge vs Market: {va.get('edge', 'N/A')}\n", "cyan"),
+            (f"  • Model Probability: {va.get('model_probability', 'N/A')}\n", "cyan"),
+            (f"  • Implied Probability: {va.get('implied_probability', 'N/A')}\n", "cyan"),
+        ]
     
-    panel = Panel(content, title=title, border_style="green", padding=(1, 2))
-    console.print(panel)
-    console.print()
+    content = Text.assemble(*parts)
+    return Panel(content, title=title, border_style="green", padding=(1, 2))
 
 
-def _display_summary(recommendations: list):
-    """Display summary table"""
+# Summary table columns as (header, style, justify). Rich columns hold their
+# cells, so each table gets fresh Column objects built from this spec
+_SUMMARY_COLUMNS = (
+    ("Rank", "cyan", "center"),
+    ("Event", "white", "left"),
+    ("Selection", "green", "left"),
+    ("Odds", "yellow", "right"),
+    ("Confidence", "green", "right"),
+    ("EV", "green", "right"),
+    ("Stake", "magenta", "right"),
+)
+
+
+def _build_summary(recommendations: list) -> Group:
+    """Build the summary table and total stake line"""
     
     table = Table(title="📈 Summary", show_header=True, header_style="bold magenta")
-    table.add_column("Rank", style="cyan", justify="center")
-    table.add_column("Event", style="white")
-    table.add_column("Selection", style="green")
-    table.add_column("Odds", style="yellow", justify="right")
-    table.add_column("Confidence", style="green", justify="right")
-    table.add_column("EV", style="green", justify="right")
-    table.add_column("Stake", style="magenta", justify="right")
+    for header, style, justify in _SUMMARY_COLUMNS:
+        table.add_column(header, style=style, justify=justify)
     
-    total_stake = 0
     for rec in recommendations:
+        event_name = rec['event_name']
         table.add_row(
             str(rec['rank']),
-            rec['event_name'][:40] + "..." if len(rec['event_name']) > 40 else rec['event_name'],
+            event_name[:40] + "..." if len(event_name) > 40 else event_name,
             rec['selection'],
             f"{rec['recommended_odds']:.2f}",
             f"{rec['confidence_score']:.1f}%",
             f"+{rec['expected_value']*100:.1f}%",
             f"${rec['recommended_stake']:.2f}"
         )
-        total_stake += rec['recommended_stake']
+    total_stake = sum(rec['recommended_stake'] for rec in recommendations)
     
-    console.print(table)
-    console.print(f"\n[bold]Total Recommended Stake: [green]${total_stake:.2f}[/green][/bold]\n")
+    return Group(
+        table,
+        console.render_str(f"\n[bold]Total Recommended Stake: [green]${total_stake:.2f}[/green][/bold]\n")
+    )
 
 
 @cli.command()
@@ -168,6 +293,8 @@ def _display_summary(recommendations: list):
 def balance(currency):
     """Check wallet balance"""
     try:
+        from src.integrations.crypto_wallet import get_crypto_wallet
+        
         console.print(f"\n[yellow]Checking {currency} balance...[/yellow]\n")
         
         wallet = get_crypto_wallet()
@@ -199,6 +326,7 @@ def status():
         # Crypto wallet
         console.print("\n[yellow]Checking crypto wallet...[/yellow]")
         try:
+            from src.integrations.crypto_wallet import get_crypto_wallet
             wallet = get_crypto_wallet()
             console.print("[green]✓ Wallet initialized[/green]")
             console.print(f"Address: [cyan]{wallet.wallet_address}[/cyan]")
@@ -207,7 +335,12 @@ def status():
         
         # Stake client
         console.print("\n[yellow]Checking Stake.com connection...[/yellow]")
-        console.print("[green]✓ Client initialized[/green]")
+        from src.integrations.stake_client import get_stake_client
+        result = _run(get_stake_client().check_connection())
+        if not result.get('error'):
+            console.print("[green]✓ Connected[/green]")
+        else:
+            console.print(f"[red]✗ Stake error: {result.get('status_code') or result['error']}[/red]")
         
         console.print("\n[bold green]System operational ✓[/bold green]\n")
         
@@ -223,16 +356,20 @@ def upcoming_events(sport, limit):
     console.print("\n[bold cyan]📅 Upcoming Events[/bold cyan]\n")
     
     try:
-        with db_manager.get_session() as db:
-            from src.database.models import Event
+        with _session() as db:
+            from sqlalchemy.orm import contains_eager, joinedload
+            from src.database.models import Event, Sport
             
             query = db.query(Event).filter(
                 Event.status == 'upcoming',
                 Event.start_time >= datetime.utcnow()
             )
             
+            # Load each event's sport in the same statement, not one query per row
             if sport:
-                query = query.join(Event.sport).filter(Sport.name == sport)
+                query = query.join(Event.sport).filter(Sport.name == sport).options(contains_eager(Event.sport))
+            else:
+                query = query.options(joinedload(Event.sport))
             
             events = query.order_by(Event.start_time).limit(limit).all()
             
@@ -279,6 +416,7 @@ def seed_demo():
     console.print("\n[bold cyan]🧪 Seeding demo data...[/bold cyan]\n")
 
     try:
+        from sqlalchemy import insert, select
         from src.database.models import Sport, Event, Odds
 
         demo_sports = [
@@ -314,78 +452,67 @@ def seed_demo():
             },
         ]
 
-        with db_manager.get_session() as db:
-            # Ensure sports exist
-            sports_map = {}
-            for sport in demo_sports:
-                existing = db.query(Sport).filter(Sport.name == sport["name"]).first()
-                if existing:
-                    sports_map[sport["name"]] = existing
-                    continue
-
-                new_sport = Sport(
-                    name=sport["name"],
-                    category=sport["category"],
-                    is_active=True
-                )
-                db.add(new_sport)
-                db.flush()
-                sports_map[sport["name"]] = new_sport
+        with _session() as db:
+            # Sports: one idempotent bulk insert, then one lookup for their ids
+            db.execute(
+                insert_ignore(db, Sport)
+                .values([
+                    {"name": s["name"], "category": s["category"], "is_active": True}
+                    for s in demo_sports
+                ])
+                .on_conflict_do_nothing(index_elements=["name"])
+            )
+            sport_ids = dict(db.execute(
+                select(Sport.name, Sport.id)
+                .where(Sport.name.in_([s["name"] for s in demo_sports]))
+            ).all())
 
-            created_events = 0
-            created_odds = 0
             now = datetime.utcnow()
 
-            for event in demo_events:
-                existing_event = db.query(Event).filter(
-                    Event.external_id == event["external_id"]
-                ).first()
-
-                if existing_event:
-                    db_event = existing_event
-                else:
-                    db_event = Event(
-                        sport_id=sports_map[event["sport"]].id,
-                        external_id=event["external_id"],
-                        name=event["name"],
-                        home_team=event["home_team"],
-                        away_team=event["away_team"],
-                        start_time=now + timedelta(hours=event["hours_from_now"]),
-                        status="upcoming",
-                        venue="Demo Arena",
-                    )
-                    db.add(db_event)
-                    db.flush()
-                    created_events += 1
-
-                # Seed odds if missing
-                selections = [
-                    ("home", 2.15),
-                    ("away", 2.55),
-                    ("draw", 3.2),
-                ]
-
-                for selection, odds_decimal in selections:
-                    existing_odds = db.query(Odds).filter(
-                        Odds.event_id == db_event.id,
-                        Odds.selection == selection,
-                        Odds.is_current == True
-                    ).first()
-
-                    if existing_odds:
-                        continue
-
-                    db.add(Odds(
-                        event_id=db_event.id,
-                        bookmaker="DemoBook",
-                        market_type="moneyline",
-                        selection=selection,
-                        odds_decimal=odds_decimal,
-                        odds_american=None,
-                        odds_fractional=None,
-                        is_current=True
-                    ))
-                    created_odds += 1
+            # Events: one bulk insert; RETURNING only yields rows actually inserted
+            result = db.execute(
+                insert_ignore(db, Event)
+                .values([
+                    {
+                        "sport_id": sport_ids[event["sport"]],
+                        "external_id": event["external_id"],
+                        "name": event["name"],
+                        "home_team": event["home_team"],
+                        "away_team": event["away_team"],
+                        "start_time": now + timedelta(hours=event["hours_from_now"]),
+                        "status": "upcoming",
+                        "venue": "Demo Arena",
+                    }
+                    for event in demo_events
+                ])
+                .on_conflict_do_nothing(index_elements=["external_id"])
+                .returning(Event.external_id, Event.id)
+            )
+            event_ids = {row.external_id: row.id for row in result}
+            created_events = len(event_ids)
+
+            # Odds only for events created above; existing demo events got theirs
+            # when they were first seeded
+            selections = [
+                ("home", 2.15),
+                ("away", 2.55),
+                ("draw", 3.2),
+            ]
+            new_odds = [
+                {
+                    "event_id": event_id,
+                    "bookmaker": "DemoBook",
+                    "market_type": "moneyline",
+                    "selection": selection,
+                    "odds_decimal": odds_decimal,
+                    "is_current": True,
+                }
+                for event_id in event_ids.values()
+                for selection, odds_decimal in selections
+            ]
+            created_odds = len(new_odds)
+            if new_odds:
+                db.execute(insert(Odds), new_odds)
 
             console.print(
                 f"[green]✓ Demo data ready: {created_events} events, {created_odds} odds entries[/green]\n"
@@ -399,22 +526,22 @@ def seed_demo():
 @cli.command()
 @click.option('--sport', help='Specific sport to fetch')
 @click.option('--days', default=7, help='Number of days ahead to fetch')
-def fetch_odds(sport, days):
+@click.option('--parallel', default=4, show_default=True, help='Leagues fetched concurrently (all-sports fetch)')
+def fetch_odds(sport, days, parallel):
     """Fetch odds data from The Odds API"""
     console.print("\n[bold cyan]📊 Fetching Odds Data...[/bold cyan]\n")
     
     try:
-        import asyncio
         from src.data_ingestion.odds_ingestion_service import get_ingestion_service
         
         service = get_ingestion_service()
         
         if sport:
             console.print(f"[yellow]Fetching odds for {sport}...[/yellow]")
-            asyncio.run(service.process_sport(sport))
+            _run(service.process_sport(sport))
         else:
             console.print("[yellow]Fetching odds for all sports...[/yellow]")
-            asyncio.run(service.fetch_and_store_odds())
+            _run(service.fetch_and_store_odds(concurrency=parallel))
         
         console.print("\n[green]✓ Odds data fetched successfully[/green]\n")
         
@@ -429,7 +556,6 @@ def start_odds_service():
     console.print("\n[bold cyan]🔄 Starting Odds Ingestion Service...[/bold cyan]\n")
     
     try:
-        import asyncio
         from src.data_ingestion.odds_ingestion_service import get_ingestion_service
         
         service = get_ingestion_service(update_interval=60)
@@ -437,7 +563,7 @@ def start_odds_service():
         console.print("[green]Service started. Press Ctrl+C to stop.[/green]\n")
         console.print("[yellow]Updating odds every 60 seconds...[/yellow]\n")
         
-        asyncio.run(service.start())
+        _run(service.start())
         
     except KeyboardInterrupt:
         console.print("\n[yellow]Service stopped by user[/yellow]\n")
@@ -452,25 +578,30 @@ def find_arbitrage():
     console.print("\n[bold cyan]💎 Finding Arbitrage Opportunities...[/bold cyan]\n")
     
     try:
-        import asyncio
         from src.data_ingestion.odds_ingestion_service import get_ingestion_service
         
         service = get_ingestion_service()
-        opportunities = asyncio.run(service.get_arbitrage_opportunities())
         
-        if not opportunities:
+        # Print each opportunity as soon as its sport has been checked
+        async def stream_opportunities() -> int:
+            count = 0
+            async for opp in service.iter_arbitrage_opportunities():
+                count += 1
+                console.print(f"[bold]Opportunity #{count}:[/bold]")
+                console.print(f"  Event: {opp['event']}")
+                console.print(f"  Sport: {opp['sport']}")
+                console.print(f"  Profit Margin: [green]{opp['profit_margin']:.2f}%[/green]")
+                console.print(f"  Stakes: {opp['stakes']}")
+                console.print(f"  Best Odds: {opp['best_odds']}\n")
+            return count
+        
+        count = _run(stream_opportunities())
+        
+        if not count:
             console.print("[yellow]No arbitrage opportunities found.[/yellow]\n")
             return
         
-        console.print(f"[green]Found {len(opportunities)} arbitrage opportunities![/green]\n")
-        
-        for i, opp in enumerate(opportunities, 1):
-            console.print(f"[bold]Opportunity #{i}:[/bold]")
-            console.print(f"  Event: {opp['event']}")
-            console.print(f"  Sport: {opp['sport']}")
-            console.print(f"  Profit Margin: [green]{opp['profit_margin']:.2f}%[/green]")
-            console.print(f"  Stakes: {opp['stakes']}")
-            console.print(f"  Best Odds: {opp['best_odds']}\n")
+        console.print(f"[green]Found {count} arbitrage opportunities![/green]\n")
         
     except Exception as e:
         console.print(f"[red]Error: {e}[/red]\n")
@@ -483,11 +614,10 @@ def api_usage():
     console.print("\n[bold cyan]📈 API Usage Statistics[/bold cyan]\n")
     
     try:
-        import asyncio
         from src.data_ingestion.odds_ingestion_service import get_ingestion_service
         
         service = get_ingestion_service()
-        stats = asyncio.run(service.get_usage_stats())
+        stats = _run(service.get_usage_stats())
         
         if stats:
             console.print(f"[bold]Requests Used:[/bold] {stats.get('requests_used', 'N/A')}")
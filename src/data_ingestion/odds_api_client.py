@@ -3,9 +3,16 @@ The Odds API Client - Real-time sports odds data
 API Documentation: https://the-odds-api.com/liveapi/guides/v4/
 """
 import httpx
+import orjson
+from cachetools import TTLCache
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 import asyncio
+try:
+    import h2  # noqa: F401 — enables HTTP/2 in httpx
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
 
 from src.utils.logger import get_logger
 from src.utils.config_loader import get_config
@@ -13,6 +20,48 @@ from src.utils.config_loader import get_config
 logger = get_logger(__name__)
 config = get_config()
 
+# Pool sizing for the shared client: the ingestion loop, concurrent league
+# fetches and arbitrage scans all hit the same host
+ODDS_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=50, keepalive_expiry=120)
+ODDS_HTTP_RETRIES = 2
+
+# The sports list only changes when leagues go in or out of season, yet the
+# ingestion loop asks for it every cycle; an hour of staleness at worst delays
+# picking up a newly active league by one hour
+SPORTS_CACHE_TTL = 3600
+# Quota headers change with every odds call; 30s keeps repeated usage checks
+# (CLI, dashboards) from each costing a request while staying near-current
+QUOTA_CACHE_TTL = 30
+
+
+
+def _api_timestamp(dt: datetime) -> str:
+    """
+    Format a UTC datetime the way the API expects (``2024-01-01T12:00:00Z``)
+    
+    Args:
+        dt: UTC datetime (naive, or aware with UTC offset)
+    
+    Returns:
+        ISO-8601 timestamp with second precision and a Z suffix
+    """
+    return dt.replace(tzinfo=None).isoformat(timespec='seconds') + 'Z'
+
+
+
+def _decode(response: httpx.Response) -> Any:
+    """
+    Decode a JSON response body with orjson (faster than httpx's stdlib json
+    on the nested bookmaker/market/outcome payloads)
+    
+    Args:
+        response: HTTP response
+    
+    Returns:
+        Decoded JSON
+    """
+    return orjson.loads(response.content)
+
 
 class OddsAPIClient:
     """
@@ -30,12 +79,13 @@ class OddsAPIClient:
         self.base_url = "https://api.the-odds-api.com/v4"
         self.timeout = 30
         
-        # HTTP client
-        self.client = httpx.AsyncClient(
-            base_url=self.base_url,
-            timeout=self.timeout,
-            headers={'User-Agent': 'BettingAI/1.0'}
-        )
+        # HTTP client, created on first use inside the running event loop
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Response caches (failed requests are not cached)
+        self._sports_cache: TTLCache = TTLCache(maxsize=1, ttl=SPORTS_CACHE_TTL)
+        self._quota_cache: TTLCache = TTLCache(maxsize=1, ttl=QUOTA_CACHE_TTL)
 
         # Track remaining API credits (updated after each /odds call)
         self.credits_remaining: Optional[int] = None
@@ -92,13 +142,45 @@ class OddsAPIClient:
         
         logger.info("Odds API client initialized")
     
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        Pooled HTTP client bound to the running event loop
+        
+        Pooled connections belong to the loop that opened them, so a client
+        first used on another (e.g. since closed) loop is replaced.
+        
+        Returns:
+            HTTP client
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                headers={'User-Agent': 'BettingAI/1.0'},
+                # Limits and HTTP/2 go on the transport: the client ignores
+                # them when a transport is given
+                transport=httpx.AsyncHTTPTransport(
+                    limits=ODDS_HTTP_LIMITS,
+                    http2=HAS_HTTP2,
+                    retries=ODDS_HTTP_RETRIES,
+                ),
+            )
+            self._client_loop = loop
+        return self._client
+    
     async def get_sports(self) -> List[Dict[str, Any]]:
         """
-        Get list of available sports
+        Get list of available sports, cached for SPORTS_CACHE_TTL seconds
         
         Returns:
             List of sports with details
         """
+        sports = self._sports_cache.get('sports')
+        if sports is not None:
+            return sports
+        
         try:
             response = await self.client.get(
                 '/sports',
@@ -106,9 +188,12 @@ class OddsAPIClient:
             )
             response.raise_for_status()
             
-            sports = response.json()
+            sports = _decode(response)
             logger.info(f"Retrieved {len(sports)} sports from Odds API")
             
+            self._sports_cache['sports'] = sports
+            # Same endpoint the quota check uses, so refresh that too
+            self._quota_cache['quota'] = self._quota_from_headers(response.headers)
             return sports
             
         except Exception as e:
@@ -160,10 +245,10 @@ class OddsAPIClient:
                 params['eventIds'] = ','.join(event_ids)
             
             if commence_time_from:
-                params['commenceTimeFrom'] = commence_time_from.strftime('%Y-%m-%dT%H:%M:%SZ')
+                params['commenceTimeFrom'] = _api_timestamp(commence_time_from)
 
             if commence_time_to:
-                params['commenceTimeTo'] = commence_time_to.strftime('%Y-%m-%dT%H:%M:%SZ')
+                params['commenceTimeTo'] = _api_timestamp(commence_time_to)
             
             response = await self.client.get(
                 f'/sports/{sport_key}/odds',
@@ -171,7 +256,7 @@ class OddsAPIClient:
             )
             response.raise_for_status()
             
-            events = response.json()
+            events = _decode(response)
             
             # Log remaining requests
             remaining = response.headers.get('x-requests-remaining')
@@ -228,7 +313,7 @@ class OddsAPIClient:
             )
             response.raise_for_status()
             
-            event = response.json()
+            event = _decode(response)
             logger.debug(f"Retrieved odds for event {event_id}")
             
             return event
@@ -265,7 +350,7 @@ class OddsAPIClient:
                 'markets': ','.join(markets or self.markets),
                 'oddsFormat': 'decimal',
                 'dateFormat': 'iso',
-                'date': date.strftime('%Y-%m-%dT%H:%M:%SZ')
+                'date': _api_timestamp(date)
             }
             
             response = await self.client.get(
@@ -274,7 +359,7 @@ class OddsAPIClient:
             )
             response.raise_for_status()
             
-            events = response.json()
+            events = _decode(response)
             logger.info(f"Retrieved {len(events)} historical events for {date.date()}")
             
             return events
@@ -314,7 +399,7 @@ class OddsAPIClient:
             )
             response.raise_for_status()
 
-            events = response.json()
+            events = _decode(response)
             remaining = response.headers.get('x-requests-remaining')
             self.credits_remaining = int(remaining) if remaining else self.credits_remaining
             completed = [e for e in events if e.get('completed')]
@@ -337,11 +422,15 @@ class OddsAPIClient:
 
     async def get_usage_quota(self) -> Dict[str, Any]:
         """
-        Get API usage quota information
+        Get API usage quota information, cached for QUOTA_CACHE_TTL seconds
         
         Returns:
             Usage quota details
         """
+        quota = self._quota_cache.get('quota')
+        if quota is not None:
+            return quota
+        
         try:
             # Make a minimal request to check quota
             response = await self.client.get(
@@ -350,16 +439,31 @@ class OddsAPIClient:
             )
             response.raise_for_status()
             
-            return {
-                'requests_remaining': response.headers.get('x-requests-remaining'),
-                'requests_used': response.headers.get('x-requests-used'),
-                'requests_last': response.headers.get('x-requests-last')
-            }
+            quota = self._quota_from_headers(response.headers)
+            self._quota_cache['quota'] = quota
+            return quota
             
         except Exception as e:
             logger.error(f"Error fetching usage quota: {e}")
             return {}
     
+    @staticmethod
+    def _quota_from_headers(headers: httpx.Headers) -> Dict[str, Any]:
+        """
+        Extract usage quota details from Odds API response headers
+        
+        Args:
+            headers: Response headers
+        
+        Returns:
+            Usage quota details
+        """
+        return {
+            'requests_remaining': headers.get('x-requests-remaining'),
+            'requests_used': headers.get('x-requests-used'),
+            'requests_last': headers.get('x-requests-last')
+        }
+    
     def parse_odds_data(self, event: Dict[str, Any]) -> Dict[str, Any]:
         """
         Parse odds data into standardized format
@@ -375,6 +479,8 @@ class OddsAPIClient:
             'sport': event.get('sport_key'),
             'sport_title': event.get('sport_title'),
             'commence_time': event.get('commence_time'),
+            # Parsed once here for the storage path (3.11+ accepts the Z suffix)
+            'commence_time_dt': datetime.fromisoformat(event['commence_time']) if event.get('commence_time') else None,
             'home_team': event.get('home_team'),
             'away_team': event.get('away_team'),
             'bookmakers': []
@@ -438,6 +544,38 @@ class OddsAPIClient:
         
         return best_odds
     
+    def scan_event_for_arbitrage(self, event: Dict[str, Any], market: str = 'h2h') -> Dict[str, Any]:
+        """
+        Find best odds and check arbitrage in one pass over a raw API event,
+        without building the parse_odds_data structure first
+        
+        Args:
+            event: Raw event data from API
+            market: Market type (h2h, spreads, totals)
+        
+        Returns:
+            Arbitrage analysis, as from calculate_arbitrage
+        """
+        best_odds = {}
+        
+        for bookmaker in event.get('bookmakers', []):
+            for mkt in bookmaker.get('markets', []):
+                if mkt.get('key') != market:
+                    continue
+                for outcome in mkt.get('outcomes', []):
+                    name = outcome.get('name')
+                    price = outcome.get('price')
+                    
+                    best = best_odds.get(name)
+                    if best is None or price > best['price']:
+                        best_odds[name] = {
+                            'price': price,
+                            'bookmaker': bookmaker.get('key'),
+                            'bookmaker_title': bookmaker.get('title')
+                        }
+        
+        return self.calculate_arbitrage(best_odds)
+    
     def calculate_arbitrage(self, best_odds: Dict[str, Any]) -> Dict[str, Any]:
         """
         Calculate if arbitrage opportunity exists
@@ -484,7 +622,10 @@ class OddsAPIClient:
     
     async def close(self):
         """Close HTTP client"""
-        await self.client.aclose()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
         logger.info("Odds API client closed")
 
 
@@ -503,3 +644,9 @@ def get_odds_client() -> OddsAPIClient:
     if _odds_client is None:
         _odds_client = OddsAPIClient()
     return _odds_client
+
+
+async def close_odds_client():
+    """Close the Odds API client singleton's pooled connections"""
+    if _odds_client is not None:
+        await _odds_client.close()
@@ -4,17 +4,67 @@ Odds Ingestion Service - Continuously fetches and stores odds data
 import asyncio
 import os
 import httpx
-from typing import List, Dict, Any
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
 from datetime import datetime, timedelta
+from sqlalchemy import insert, update
 from sqlalchemy.orm import Session
 
 from src.data_ingestion.odds_api_client import get_odds_client
-from src.database.database import db_manager
+from src.database.database import db_manager, insert_ignore
 from src.database.models import Sport, Event, Odds
 from src.utils.logger import get_logger, betting_logger
 
 logger = get_logger(__name__)
 
+# Callbacks invoked with an event id once that event's current odds have
+# been replaced (e.g. so API prediction caches drop stale entries)
+_odds_listeners: List[Callable[[int], None]] = []
+
+
+def add_odds_listener(callback: Callable[[int], None]):
+    """
+    Register a callback to be notified whenever an event's odds are updated
+    
+    Args:
+        callback: Called with the event id after its new odds are committed
+    """
+    if callback not in _odds_listeners:
+        _odds_listeners.append(callback)
+
+
+def _notify_odds_updated(event_id: int):
+    """Invoke odds listeners; a failing listener never breaks ingestion."""
+    for callback in list(_odds_listeners):
+        try:
+            callback(event_id)
+        except Exception as e:
+            logger.warning(f"Odds listener failed for event {event_id}: {e}")
+
+
+# Callbacks invoked with a sport name once a batch that created that sport
+# has been committed (e.g. so the API's cached sports list is dropped)
+_sport_listeners: List[Callable[[str], None]] = []
+
+
+def add_sport_listener(callback: Callable[[str], None]):
+    """
+    Register a callback to be notified whenever ingestion creates a sport
+    
+    Args:
+        callback: Called with the sport name after its row is committed
+    """
+    if callback not in _sport_listeners:
+        _sport_listeners.append(callback)
+
+
+def _notify_sport_created(sport_name: str):
+    """Invoke sport listeners; a failing listener never breaks ingestion."""
+    for callback in list(_sport_listeners):
+        try:
+            callback(sport_name)
+        except Exception as e:
+            logger.warning(f"Sport listener failed for {sport_name}: {e}")
+
 
 class OddsIngestionService:
     """
@@ -68,6 +118,16 @@ class OddsIngestionService:
 
         # Maximum number of league API calls per fetch cycle (saves credits)
         self.max_leagues_per_fetch = int(os.getenv('MAX_LEAGUES_PER_FETCH', '10'))
+
+        # League requests in flight at once during a fetch cycle
+        self.fetch_concurrency = int(os.getenv('ODDS_FETCH_CONCURRENCY', '4'))
+        
+        # Worker threads writing fetched leagues to the database; SQLite's
+        # single shared connection (StaticPool) allows only one
+        if db_manager.engine.dialect.name == 'sqlite':
+            self.store_concurrency = 1
+        else:
+            self.store_concurrency = int(os.getenv('ODDS_STORE_CONCURRENCY', '2'))
         
         logger.info(f"Odds ingestion service initialized (interval: {update_interval}s)")
     
@@ -89,8 +149,21 @@ class OddsIngestionService:
         self.is_running = False
         logger.info("Stopping odds ingestion service")
     
-    async def fetch_and_store_odds(self):
-        """Fetch odds for active leagues, prioritising popular ones and respecting credit limits."""
+    async def fetch_and_store_odds(self, concurrency: Optional[int] = None) -> int:
+        """
+        Fetch odds for active leagues, prioritising popular ones and respecting credit limits.
+
+        Fetching and storing are pipelined: fetched leagues are queued for
+        store_concurrency worker threads, so database writes never block the
+        event loop and a league's insert overlaps the next league's request.
+
+        Args:
+            concurrency: League requests in flight at once (default
+                ODDS_FETCH_CONCURRENCY); leagues still start in priority order
+
+        Returns:
+            Number of events stored across all fetched leagues
+        """
         logger.info("Fetching live odds data...")
 
         available_sports = await self.odds_client.get_sports()
@@ -129,19 +202,54 @@ class OddsIngestionService:
 
         logger.info(f"Will fetch odds for {len(ordered_keys)} leagues (limit {fetch_limit}): {ordered_keys}")
 
-        total_events = 0
-        for league_key in ordered_keys:
-            sport_name = key_to_sport[league_key]
-            try:
-                count = await self.process_sport_key(sport_name, league_key)
-                total_events += count
-            except Exception as e:
-                if 'OUT_OF_USAGE_CREDITS' in str(e):
-                    logger.warning("API credits exhausted — stopping fetch loop early")
-                    break
-                logger.error(f"Error processing {league_key}: {e}")
+        sem = asyncio.Semaphore(max(1, concurrency or self.fetch_concurrency))
+        store_workers = max(1, self.store_concurrency)
+        # Bounded, so fetched payloads wait in memory only briefly
+        queue: asyncio.Queue = asyncio.Queue(maxsize=store_workers)
+        credits_exhausted = False
+
+        async def fetch_league(league_key: str):
+            nonlocal credits_exhausted
+            async with sem:
+                # Leagues still waiting once credits run out are skipped
+                if credits_exhausted:
+                    return
+                try:
+                    events = await self._fetch_league_events(league_key)
+                except Exception as e:
+                    if 'OUT_OF_USAGE_CREDITS' in str(e):
+                        if not credits_exhausted:
+                            logger.warning("API credits exhausted — stopping fetch loop early")
+                        credits_exhausted = True
+                    else:
+                        logger.error(f"Error processing {league_key}: {e}")
+                    return
+            if events:
+                await queue.put((league_key, events))
+
+        async def store_worker() -> int:
+            stored = 0
+            while (item := await queue.get()) is not None:
+                league_key, events = item
+                try:
+                    stored += await asyncio.to_thread(
+                        self._store_league_events, key_to_sport[league_key], league_key, events
+                    )
+                except Exception as e:
+                    logger.error(f"Error storing {league_key}: {e}")
+            return stored
+
+        async with asyncio.TaskGroup() as tg:
+            workers = [tg.create_task(store_worker()) for _ in range(store_workers)]
+            async with asyncio.TaskGroup() as fetch_tg:
+                for league_key in ordered_keys:
+                    fetch_tg.create_task(fetch_league(league_key))
+            for _ in workers:
+                await queue.put(None)
+        total_events = sum(worker.result() for worker in workers)
 
         logger.info(f"Live odds fetch complete — {total_events} events across {len(ordered_keys)} leagues")
+        return total_events
     
     async def process_sport(self, sport: str):
         """Legacy: process a single mapped sport key."""
@@ -157,121 +265,237 @@ class OddsIngestionService:
             league_key: Odds API sport key (e.g. 'soccer_epl')
 
         Returns:
-            Number of events processed
+            Number of events stored
         """
         try:
-            commence_time_from = datetime.utcnow()
-            commence_time_to = commence_time_from + timedelta(days=7)
-
-            events = await self.odds_client.get_odds(
-                sport=league_key,   # pass the full API key directly
-                commence_time_from=commence_time_from,
-                commence_time_to=commence_time_to
-            )
-
+            events = await self._fetch_league_events(league_key)
             if not events:
-                logger.debug(f"No events found for {league_key}")
                 return 0
-
-            logger.info(f"Processing {len(events)} events for {league_key}")
-
-            with db_manager.get_session() as db:
-                for event_data in events:
-                    self.store_event_and_odds(db, event_data, sport_name)
-
-            return len(events)
+            return await asyncio.to_thread(self._store_league_events, sport_name, league_key, events)
 
         except httpx.HTTPStatusError:
             raise  # Propagate 401 etc. so the fetch loop can stop early
         except Exception as e:
             logger.error(f"Error processing {league_key}: {e}")
             return 0
+
+    async def _fetch_league_events(self, league_key: str) -> List[Dict[str, Any]]:
+        """
+        Fetch the next week's events and odds for one league key.
+
+        Args:
+            league_key: Odds API sport key (e.g. 'soccer_epl')
+
+        Returns:
+            Raw event data from API
+        """
+        commence_time_from = datetime.utcnow()
+        commence_time_to = commence_time_from + timedelta(days=7)
+
+        # Restrict the fetch to the client's bookmakers list: books outside it
+        # (e.g. caesars, betrivers) are not returned and so never stored,
+        # which also shrinks the payload
+        events = await self.odds_client.get_odds(
+            sport=league_key,   # pass the full API key directly
+            bookmakers=self.odds_client.bookmakers,
+            commence_time_from=commence_time_from,
+            commence_time_to=commence_time_to
+        )
+
+        if not events:
+            logger.debug(f"No events found for {league_key}")
+        return events
+
+    def _store_league_events(self, sport_name: str, league_key: str, events: List[Dict[str, Any]]) -> int:
+        """
+        Store one league's fetched events in their own session (blocking;
+        run it in a worker thread).
+
+        Args:
+            sport_name: Canonical sport name (e.g. 'soccer')
+            league_key: Odds API sport key (e.g. 'soccer_epl')
+            events: Raw event data from API
+
+        Returns:
+            Number of events stored
+        """
+        logger.info(f"Processing {len(events)} events for {league_key}")
+
+        with db_manager.get_session() as db:
+            return self.store_events_and_odds(db, events, sport_name)
     
-    def store_event_and_odds(
+    def store_events_and_odds(
         self,
         db: Session,
-        event_data: Dict[str, Any],
+        events: List[Dict[str, Any]],
         sport_name: str
-    ):
+    ) -> int:
         """
-        Store event and odds in database
+        Store a batch of events and their odds in one transaction
+        
+        The sport row and every already-known event are loaded up front
+        (one query each) rather than looked up per event. Each event is then
+        written inside its own savepoint, so a bad event is rolled back on
+        its own without discarding the rest of the batch. The previous odds of
+        all stored events are retired with one UPDATE, the new odds written
+        with one executemany INSERT, and listeners (odds, plus sport if one
+        was created) notified once the batch is committed.
         
         Args:
             db: Database session
-            event_data: Event data from API
+            events: Event data from API
             sport_name: Sport name
+        
+        Returns:
+            Number of events stored
+        """
+        now = datetime.utcnow()
+        
+        # Keyed by external ID: if the API repeats an event, the last copy
+        # wins, so its odds are inserted (and counted) only once
+        parsed_by_id: Dict[str, Dict[str, Any]] = {}
+        for event_data in events:
+            try:
+                parsed = self.odds_client.parse_odds_data(event_data)
+            except Exception as e:
+                logger.error(f"Error parsing event data: {e}")
+                continue
+            parsed_by_id.pop(parsed['external_id'], None)
+            parsed_by_id[parsed['external_id']] = parsed
+        parsed_events = list(parsed_by_id.values())
+        if not parsed_events:
+            return 0
+        
+        # Get or create sport. Leagues sharing a sport are stored by
+        # concurrent workers, so creation is an idempotent insert: a worker
+        # that loses the race skips it and picks up the winner's row
+        sport = db.query(Sport).filter(Sport.name == sport_name).first()
+        sport_created = False
+        if not sport:
+            # RETURNING only yields a row if this worker's insert won
+            sport_created = db.execute(
+                insert_ignore(db, Sport)
+                .values(name=sport_name, category='team_sport', is_active=True)
+                .on_conflict_do_nothing(index_elements=["name"])
+                .returning(Sport.id)
+            ).first() is not None
+            sport = db.query(Sport).filter(Sport.name == sport_name).one()
+        
+        external_ids = list(parsed_by_id)
+        existing_events = {
+            event.external_id: event
+            for event in db.query(Event).filter(Event.external_id.in_(external_ids))
+        }
+        
+        stored_ids = []
+        odds_rows: List[Dict[str, Any]] = []
+        for parsed in parsed_events:
+            event_id = self.store_event_and_odds(db, parsed, sport, existing_events, odds_rows, now=now)
+            if event_id is not None:
+                stored_ids.append(event_id)
+        
+        if stored_ids:
+            # Retire the previous odds of every stored event in one UPDATE
+            db.execute(
+                update(Odds)
+                .where(Odds.event_id.in_(stored_ids), Odds.is_current == True)
+                .values(is_current=False)
+                .execution_options(synchronize_session=False)
+            )
+        if odds_rows:
+            # Plain rows in one executemany INSERT, without building ORM objects
+            db.execute(insert(Odds), odds_rows)
+        
+        db.commit()
+        if sport_created:
+            _notify_sport_created(sport_name)
+        for event_id in stored_ids:
+            _notify_odds_updated(event_id)
+        return len(stored_ids)
+    
+    def store_event_and_odds(
+        self,
+        db: Session,
+        parsed: Dict[str, Any],
+        sport: Sport,
+        existing_events: Dict[str, Event],
+        odds_rows: List[Dict[str, Any]],
+        now: Optional[datetime] = None
+    ) -> Optional[int]:
+        """
+        Store one parsed event and collect its odds rows, without committing
+        
+        The odds themselves are written (and the event's previous odds
+        retired) by store_events_and_odds for the whole batch.
+        
+        Args:
+            db: Database session
+            parsed: Event data as returned by parse_odds_data
+            sport: Sport the event belongs to
+            existing_events: Known events by external ID; a newly created
+                event is added to it
+            odds_rows: Batch of odds rows to insert; the event's rows are
+                appended to it
+            now: Timestamp for the new odds rows (default: current time)
+        
+        Returns:
+            Stored event ID, or None if the event could not be stored
         """
+        now = now or datetime.utcnow()
         try:
-            # Parse event data
-            parsed = self.odds_client.parse_odds_data(event_data)
-            
-            # Get or create sport
-            sport = db.query(Sport).filter(Sport.name == sport_name).first()
-            if not sport:
-                sport = Sport(
-                    name=sport_name,
-                    category='team_sport',
-                    is_active=True
-                )
-                db.add(sport)
-                db.flush()
-            
-            # Get or create event
-            event = db.query(Event).filter(
-                Event.external_id == parsed['external_id']
-            ).first()
-            
-            if not event:
-                event = Event(
-                    sport_id=sport.id,
-                    external_id=parsed['external_id'],
-                    name=f"{parsed['home_team']} vs {parsed['away_team']}",
-                    home_team=parsed['home_team'],
-                    away_team=parsed['away_team'],
-                    start_time=datetime.fromisoformat(parsed['commence_time'].replace('Z', '+00:00')),
-                    status='upcoming',
-                    extra_metadata={
-                        'sport_title': parsed['sport_title']
+            with db.begin_nested():
+                start_time = parsed['commence_time_dt']
+                if start_time is None:
+                    raise ValueError(f"event {parsed['external_id']} has no commence_time")
+                event = existing_events.get(parsed['external_id'])
+                
+                if not event:
+                    event = Event(
+                        sport_id=sport.id,
+                        external_id=parsed['external_id'],
+                        name=f"{parsed['home_team']} vs {parsed['away_team']}",
+                        home_team=parsed['home_team'],
+                        away_team=parsed['away_team'],
+                        start_time=start_time,
+                        status='upcoming',
+                        extra_metadata={
+                            'sport_title': parsed['sport_title']
+                        }
+                    )
+                    db.add(event)
+                    db.flush()
+                    logger.info(f"Created new event: {event.name}")
+                else:
+                    # Update event details
+                    event.start_time = start_time
+                    event.updated_at = now
+                
+                event_odds = [
+                    {
+                        'event_id': event.id,
+                        'bookmaker': bookmaker['name'],
+                        'market_type': market['key'],
+                        'selection': outcome['name'],
+                        'odds_decimal': outcome['price'],
+                        'odds_american': self.decimal_to_american(outcome['price']),
+                        'timestamp': now,
+                        'is_current': True
                     }
-                )
-                db.add(event)
-                db.flush()
-                logger.info(f"Created new event: {event.name}")
-            else:
-                # Update event details
-                event.start_time = datetime.fromisoformat(parsed['commence_time'].replace('Z', '+00:00'))
-                event.updated_at = datetime.utcnow()
-            
-            # Mark existing odds as not current
-            db.query(Odds).filter(
-                Odds.event_id == event.id,
-                Odds.is_current == True
-            ).update({'is_current': False})
+                    for bookmaker in parsed['bookmakers']
+                    for market in bookmaker['markets']
+                    for outcome in market['outcomes']
+                ]
             
-            # Store odds from each bookmaker
-            odds_count = 0
-            for bookmaker in parsed['bookmakers']:
-                for market in bookmaker['markets']:
-                    for outcome in market['outcomes']:
-                        odds_entry = Odds(
-                            event_id=event.id,
-                            bookmaker=bookmaker['name'],
-                            market_type=market['key'],
-                            selection=outcome['name'],
-                            odds_decimal=outcome['price'],
-                            odds_american=self.decimal_to_american(outcome['price']),
-                            timestamp=datetime.utcnow(),
-                            is_current=True
-                        )
-                        db.add(odds_entry)
-                        odds_count += 1
-            
-            db.commit()
-            logger.debug(f"Stored {odds_count} odds entries for event {event.id}")
+            # Only once the savepoint is released, so a rolled-back event is
+            # never handed to a later duplicate in the same batch
+            existing_events[event.external_id] = event
+            odds_rows.extend(event_odds)
+            logger.debug(f"Collected {len(event_odds)} odds entries for event {event.id}")
+            return event.id
             
         except Exception as e:
-            db.rollback()
             logger.error(f"Error storing event and odds: {e}")
+            return None
     
     def decimal_to_american(self, decimal_odds: float) -> float:
         """
@@ -303,8 +527,7 @@ class OddsIngestionService:
             event_data = await self.odds_client.get_event_odds(sport, event_id)
             
             if event_data:
-                with db_manager.get_session() as db:
-                    self.store_event_and_odds(db, event_data, sport)
+                await asyncio.to_thread(self._store_league_events, sport, sport, [event_data])
             
             return event_data
             
@@ -312,44 +535,71 @@ class OddsIngestionService:
             logger.error(f"Error fetching specific event: {e}")
             return {}
     
-    async def get_arbitrage_opportunities(self) -> List[Dict[str, Any]]:
+    async def iter_arbitrage_opportunities(
+        self,
+        concurrency: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
         """
-        Find arbitrage opportunities across all events
+        Find arbitrage opportunities across all events, yielding each one as
+        soon as its sport's odds have been fetched and checked
         
-        Returns:
-            List of arbitrage opportunities
+        Args:
+            concurrency: Sport requests in flight at once (default
+                ODDS_FETCH_CONCURRENCY); sports are checked as they arrive
+        
+        Yields:
+            Arbitrage opportunity
         """
-        opportunities = []
+        sem = asyncio.Semaphore(max(1, concurrency or self.fetch_concurrency))
+        
+        async def fetch_sport(sport: str) -> List[Dict[str, Any]]:
+            async with sem:
+                try:
+                    return await self.odds_client.get_odds(sport=sport)
+                except Exception as e:
+                    logger.error(f"Error fetching odds for arbitrage ({sport}): {e}")
+                    return []
         
+        tasks = [asyncio.create_task(fetch_sport(sport)) for sport in self.tracked_sports]
         try:
-            for sport in self.tracked_sports:
-                events = await self.odds_client.get_odds(sport=sport)
+            for next_done in asyncio.as_completed(tasks):
+                events = await next_done
                 
                 for event_data in events:
-                    parsed = self.odds_client.parse_odds_data(event_data)
-                    best_odds = self.odds_client.get_best_odds(parsed, market='h2h')
-                    arbitrage = self.odds_client.calculate_arbitrage(best_odds)
+                    # Single pass over the raw event; no parsed copy needed here
+                    arbitrage = self.odds_client.scan_event_for_arbitrage(event_data, market='h2h')
                     
                     if arbitrage.get('has_arbitrage'):
-                        opportunities.append({
-                            'event': f"{parsed['home_team']} vs {parsed['away_team']}",
-                            'sport': parsed['sport_title'],
-                            'commence_time': parsed['commence_time'],
-                            'profit_margin': arbitrage['profit_margin'],
-                            'stakes': arbitrage['stakes'],
-                            'best_odds': arbitrage['best_odds']
-                        })
-                        
+                        event_name = f"{event_data.get('home_team')} vs {event_data.get('away_team')}"
                         betting_logger.logger.info(
-                            f"Arbitrage opportunity found: {parsed['home_team']} vs {parsed['away_team']} "
+                            f"Arbitrage opportunity found: {event_name} "
                             f"({arbitrage['profit_margin']:.2f}% profit)"
                         )
-            
-            return opportunities
+                        
+                        yield {
+                            'event': event_name,
+                            'sport': event_data.get('sport_title'),
+                            'commence_time': event_data.get('commence_time'),
+                            'profit_margin': arbitrage['profit_margin'],
+                            'stakes': arbitrage['stakes'],
+                            'best_odds': arbitrage['best_odds']
+                        }
             
         except Exception as e:
             logger.error(f"Error finding arbitrage opportunities: {e}")
-            return []
+        finally:
+            # Consumer stopped early or parsing failed: drop outstanding fetches
+            for task in tasks:
+                task.cancel()
+    
+    async def get_arbitrage_opportunities(self) -> List[Dict[str, Any]]:
+        """
+        Find arbitrage opportunities across all events
+        
+        Returns:
+            List of arbitrage opportunities
+        """
+        return [opp async for opp in self.iter_arbitrage_opportunities()]
     
     async def get_usage_stats(self) -> Dict[str, Any]:
         """
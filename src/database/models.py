@@ -45,7 +45,13 @@ class Event(Base):
     
     __table_args__ = (
         Index('idx_event_start_time', 'start_time'),
-        Index('idx_event_status', 'status'),
+        # Serves the "upcoming from now" range scans (and plain status
+        # filters); on PostgreSQL the listed columns are INCLUDEd so the
+        # /events projection is an index-only scan
+        Index(
+            'idx_event_upcoming', 'status', 'start_time',
+            postgresql_include=['sport_id', 'name', 'home_team', 'away_team'],
+        ),
     )
 
 
@@ -123,7 +129,8 @@ class Recommendation(Base):
     __table_args__ = (
         Index('idx_recommendation_type', 'recommendation_type'),
         Index('idx_recommendation_created', 'created_at'),
-        Index('idx_recommendation_status', 'status'),
+        # Leading status column also serves plain status filters
+        Index('idx_recommendation_status_created', 'status', 'created_at'),
     )
 
 
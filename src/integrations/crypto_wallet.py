@@ -10,6 +10,8 @@ try:
 except ImportError:
     HAS_WEB3 = False
 import json
+import requests
+from requests.adapters import HTTPAdapter
 
 from src.utils.logger import get_logger, betting_logger
 from src.utils.config_loader import get_config
@@ -17,6 +19,20 @@ from src.utils.config_loader import get_config
 logger = get_logger(__name__)
 config = get_config()
 
+# Keep-alive pool for JSON-RPC calls, sized for the API threadpool issuing
+# balance/status/gas calls concurrently (requests' default keeps only 10)
+RPC_POOL_CONNECTIONS = 50
+RPC_POOL_MAXSIZE = 100
+
+
+def _rpc_session() -> requests.Session:
+    """HTTP session whose connections are reused across RPC calls"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=RPC_POOL_CONNECTIONS, pool_maxsize=RPC_POOL_MAXSIZE)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
 
 class CryptoWallet:
     """
@@ -32,8 +48,9 @@ class CryptoWallet:
         self.gas_limit = crypto_config.get('gas_limit', 21000)
         self.gas_price_multiplier = crypto_config.get('gas_price_multiplier', 1.2)
         
-        # Initialize Web3
-        self.w3 = Web3(Web3.HTTPProvider(self.rpc_url))
+        # Initialize Web3 over a pooled keep-alive session
+        self._session = _rpc_session()
+        self.w3 = Web3(Web3.HTTPProvider(self.rpc_url, session=self._session))
         
         # Check connection
         if not self.w3.is_connected():
@@ -352,6 +369,10 @@ class CryptoWallet:
         except Exception as e:
             logger.error(f"Error estimating gas: {e}")
             return {'error': str(e)}
+    
+    def close(self):
+        """Close the pooled RPC connections"""
+        self._session.close()
 
 
 # Singleton instance
@@ -369,3 +390,11 @@ def get_crypto_wallet() -> CryptoWallet:
     if _crypto_wallet is None:
         _crypto_wallet = CryptoWallet()
     return _crypto_wallet
+
+
+def reset_crypto_wallet():
+    """Drop the wallet singleton (closing its RPC connections) so the next get_crypto_wallet() re-reads its config"""
+    global _crypto_wallet
+    if _crypto_wallet is not None:
+        _crypto_wallet.close()
+    _crypto_wallet = None
@@ -2,6 +2,7 @@
 Polymarket API Client for crypto-based betting operations
 Built on Polygon blockchain (Chain ID 137) using USDC
 """
+import asyncio
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 try:
@@ -122,9 +123,12 @@ class PolymarketClient:
                 "connected": False
             }
         try:
-            # Test with a simple read-only call
-            ok = self.client.get_ok()
-            server_time = self.client.get_server_time()
+            # Two simple read-only calls; the CLOB client is blocking, so
+            # issue both from worker threads concurrently
+            ok, server_time = await asyncio.gather(
+                asyncio.to_thread(self.client.get_ok),
+                asyncio.to_thread(self.client.get_server_time)
+            )
             
             if ok and server_time:
                 self._api_reachable = True
@@ -158,10 +162,14 @@ class PolymarketClient:
                 "credentials_saved": self.private_key is not None
             }
     
-    async def get_balance(self) -> Dict[str, Any]:
+    async def get_balance(self, connection: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Get wallet balance (requires authentication)
         
+        Args:
+            connection: Result of a check_connection() the caller just made,
+                reused instead of checking again
+        
         Returns:
             Balance information
         """
@@ -175,7 +183,8 @@ class PolymarketClient:
             # Polymarket uses USDC on Polygon
             # Balance is stored on-chain, can query via wallet address
             # For now, we'll check if client is authenticated
-            connection = await self.check_connection()
+            if connection is None:
+                connection = await self.check_connection()
             
             if connection.get("connected") and connection.get("authenticated"):
                 return {
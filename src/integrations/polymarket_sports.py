@@ -4,9 +4,16 @@ Polymarket Sports Market Discovery
 Fetches active sports-related prediction markets from Polymarket's Gamma API
 and makes them available for browsing/betting alongside sportsbook recommendations.
 """
-import requests
+import json
+import httpx
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
+try:
+    import h2  # noqa: F401 — enables HTTP/2 in httpx
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
+
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -30,6 +37,30 @@ _cached_markets: List[Dict[str, Any]] = []
 _cache_time: Optional[datetime] = None
 CACHE_TTL = timedelta(minutes=10)
 
+# Shared keep-alive client so repeat fetches reuse the TCP/TLS connection
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get or create the pooled Gamma API HTTP client"""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            base_url=GAMMA_API,
+            timeout=15,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            http2=HAS_HTTP2,
+        )
+    return _http_client
+
+
+async def close_http_client():
+    """Close the pooled Gamma API HTTP client"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
 
 def _is_sports_market(market: Dict[str, Any]) -> bool:
     """Check if a market is sports-related."""
@@ -52,7 +83,7 @@ def _is_sports_event(event: Dict[str, Any]) -> bool:
     return any(kw in text for kw in SPORTS_KEYWORDS)
 
 
-def fetch_polymarket_sports_markets(force_refresh: bool = False) -> List[Dict[str, Any]]:
+async def fetch_polymarket_sports_markets(force_refresh: bool = False) -> List[Dict[str, Any]]:
     """
     Fetch active sports prediction markets from Polymarket.
 
@@ -66,11 +97,11 @@ def fetch_polymarket_sports_markets(force_refresh: bool = False) -> List[Dict[st
 
     try:
         # Fetch events (which contain markets)
-        resp = requests.get(f'{GAMMA_API}/events', params={
+        resp = await get_http_client().get('/events', params={
             'active': 'true',
             'closed': 'false',
             'limit': 200,
-        }, timeout=15)
+        })
         resp.raise_for_status()
         events = resp.json()
 
@@ -92,7 +123,6 @@ def fetch_polymarket_sports_markets(force_refresh: bool = False) -> List[Dict[st
                 prices_raw = mkt.get('outcomePrices', '[]')
 
                 # Parse outcomes and prices
-                import json
                 try:
                     outcomes = json.loads(outcomes_raw) if isinstance(outcomes_raw, str) else outcomes_raw
                 except (json.JSONDecodeError, TypeError):
@@ -147,9 +177,9 @@ def fetch_polymarket_sports_markets(force_refresh: bool = False) -> List[Dict[st
         return _cached_markets  # Return stale cache on error
 
 
-def search_polymarket_markets(query: str) -> List[Dict[str, Any]]:
+async def search_polymarket_markets(query: str) -> List[Dict[str, Any]]:
     """Search cached Polymarket sports markets by keyword."""
-    markets = fetch_polymarket_sports_markets()
+    markets = await fetch_polymarket_sports_markets()
     q = query.lower()
     return [
         m for m in markets
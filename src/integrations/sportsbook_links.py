@@ -4,7 +4,7 @@ Sportsbook Deep Link Generator
 Maps bookmaker names from The Odds API to their actual websites
 and generates direct links for bet placement.
 """
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional
 from urllib.parse import quote
 from src.utils.logger import get_logger
 
@@ -172,6 +172,29 @@ def generate_bet_link(
     }
 
 
+def generate_bet_links_batch(recommendations: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+    """
+    Generate bet links for a list of recommendations in one pass.
+
+    Each recommendation's 'event_name' ("Home vs Away") is split once to get
+    the teams; identical (bookmaker, event) pairs share one generated link.
+
+    Returns a list of link dicts aligned with the input order.
+    """
+    links: List[Dict[str, str]] = []
+    built: Dict[tuple, Dict[str, str]] = {}
+    for rec in recommendations:
+        event_name = rec.get("event_name", "")
+        parts = event_name.split(" vs ")
+        home_team, away_team = (parts[0], parts[-1]) if len(parts) > 1 else ("", "")
+        key = (rec.get("bookmaker", ""), home_team, away_team, rec.get("sport", ""), event_name)
+        link = built.get(key)
+        if link is None:
+            link = built[key] = generate_bet_link(*key)
+        links.append(dict(link))
+    return links
+
+
 def generate_all_book_links(
     event_name: str,
     home_team: str,
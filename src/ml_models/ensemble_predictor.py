@@ -96,7 +96,8 @@ class EnsemblePredictor:
         self,
         predictions: Dict[str, Any],
         confidences: Dict[str, float],
-        probabilities: Dict[str, float]
+        probabilities: Dict[str, float],
+        timestamp: str = None
     ) -> Dict[str, Any]:
         """
         Calculate weighted ensemble prediction
@@ -105,6 +106,7 @@ class EnsemblePredictor:
             predictions: Individual model predictions
             confidences: Model confidence scores
             probabilities: Model probability estimates
+            timestamp: ISO timestamp to stamp on the result (defaults to now)
         
         Returns:
             Ensemble prediction result
@@ -162,7 +164,7 @@ class EnsemblePredictor:
             'individual_predictions': predictions,
             'individual_confidences': confidences,
             'model_weights': normalized_weights,
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': timestamp or datetime.utcnow().isoformat()
         }
     
     def _calculate_expected_value(
@@ -214,21 +216,52 @@ class EnsemblePredictor:
         """
         Generate predictions for multiple events
         
+        Models exposing ``predict_batch`` score the whole batch in one call;
+        other models fall back to per-event ``predict``.
+        
         Args:
             events_data: List of event data
         
         Returns:
             List of predictions
         """
+        if not events_data:
+            return []
+
+        model_outputs = {}
+        for model_name, model in self.models.items():
+            if model_name not in self.model_weights:
+                continue
+            try:
+                if hasattr(model, 'predict_batch'):
+                    model_outputs[model_name] = model.predict_batch(events_data)
+                else:
+                    model_outputs[model_name] = [model.predict(event_data) for event_data in events_data]
+            except Exception as e:
+                logger.error(f"Error in {model_name} batch prediction: {e}")
+                continue
+
+        timestamp = datetime.utcnow().isoformat()
         predictions = []
-        
-        for event_data in events_data:
+        for i, event_data in enumerate(events_data):
             try:
-                pred = self.predict(event_data)
-                predictions.append(pred)
+                if not model_outputs:
+                    predictions.append(self._default_prediction())
+                    continue
+
+                preds = {name: outputs[i] for name, outputs in model_outputs.items()}
+                predictions.append(self._calculate_ensemble(
+                    {name: pred['prediction'] for name, pred in preds.items()},
+                    {name: pred.get('confidence', 0.5) for name, pred in preds.items()},
+                    {name: pred.get('probability', 0.5) for name, pred in preds.items()},
+                    timestamp
+                ))
             except Exception as e:
                 logger.error(f"Error predicting event {event_data.get('id')}: {e}")
                 predictions.append(self._default_prediction())
+
+        if not model_outputs:
+            logger.warning("No valid predictions from models")
         
         return predictions
     
@@ -13,8 +13,12 @@ except ImportError:
     pd = None
     xgb = None
     HAS_ML = False
-from typing import Dict, Any, List
+from cachetools import LRUCache
+from typing import Dict, Any, List, Tuple
 from datetime import datetime
+from threading import Lock
+import mmap
+import os
 import pickle
 from pathlib import Path
 
@@ -24,6 +28,18 @@ from src.utils.config_loader import get_config
 logger = get_logger(__name__)
 config = get_config()
 
+# Feature rows whose predictions are memoized per model (odds rarely move
+# between selector runs, so most rows repeat)
+PREDICTION_CACHE_SIZE = 4096
+
+# XGBoost's own formats; anything else is treated as a pickled model bundle
+NATIVE_MODEL_SUFFIXES = ('.json', '.ubj')
+
+# Loaded model bundles keyed by path, tagged with the file's (mtime, size) so
+# every predictor shares one copy and a file is only re-read when it changes
+_loaded_models: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+_loaded_models_lock = Lock()
+
 
 class XGBoostModel:
     """
@@ -50,6 +66,10 @@ class XGBoostModel:
         self.feature_names = list(self.FEATURE_NAMES)
         self.is_trained = False
         
+        # Predictions keyed by raw feature-row bytes; cleared when the model changes
+        self._prediction_cache = LRUCache(maxsize=PREDICTION_CACHE_SIZE)
+        self._prediction_cache_lock = Lock()
+        
         # Load hyperparameters from config
         ml_config = config.get_ml_config()
         self.hyperparameters = ml_config.get('hyperparameters', {}).get('xgboost', {})
@@ -71,6 +91,20 @@ class XGBoostModel:
         
         logger.info(f"XGBoost model initialized with params: {self.params}")
     
+    # Fallback value for each feature when absent from the event data
+    FEATURE_DEFAULTS = {
+        'home_win_rate': 0.5, 'away_win_rate': 0.5,
+        'home_recent_form': 0.5, 'away_recent_form': 0.5,
+        'h2h_home_wins': 0, 'h2h_away_wins': 0, 'h2h_draws': 0,
+        'home_odds': 2.0, 'away_odds': 2.0, 'draw_odds': 3.0,
+        'odds_movement_home': 0.0, 'odds_movement_away': 0.0,
+        'is_home_game': 1, 'venue_advantage': 0.0,
+        'days_since_last_game_home': 7, 'days_since_last_game_away': 7,
+        'home_goals_scored_avg': 1.5, 'away_goals_scored_avg': 1.5,
+        'home_goals_conceded_avg': 1.5, 'away_goals_conceded_avg': 1.5,
+        'home_ranking': 50, 'away_ranking': 50, 'ranking_difference': 0,
+    }
+
     def prepare_features(self, event_data: Dict[str, Any]) -> np.ndarray:
         """
         Prepare features from event data
@@ -79,51 +113,26 @@ class XGBoostModel:
             event_data: Raw event data
         
         Returns:
-            Feature array
+            Feature array of shape (1, n_features)
         """
-        features = []
-        
-        # Extract relevant features
-        # Team/Player statistics
-        features.append(event_data.get('home_win_rate', 0.5))
-        features.append(event_data.get('away_win_rate', 0.5))
-        features.append(event_data.get('home_recent_form', 0.5))
-        features.append(event_data.get('away_recent_form', 0.5))
-        
-        # Head-to-head statistics
-        features.append(event_data.get('h2h_home_wins', 0))
-        features.append(event_data.get('h2h_away_wins', 0))
-        features.append(event_data.get('h2h_draws', 0))
-        
-        # Odds-based features
-        features.append(event_data.get('home_odds', 2.0))
-        features.append(event_data.get('away_odds', 2.0))
-        features.append(event_data.get('draw_odds', 3.0))
-        
-        # Market movement
-        features.append(event_data.get('odds_movement_home', 0.0))
-        features.append(event_data.get('odds_movement_away', 0.0))
-        
-        # Venue and conditions
-        features.append(event_data.get('is_home_game', 1))
-        features.append(event_data.get('venue_advantage', 0.0))
-        
-        # Time-based features
-        features.append(event_data.get('days_since_last_game_home', 7))
-        features.append(event_data.get('days_since_last_game_away', 7))
-        
-        # Performance metrics
-        features.append(event_data.get('home_goals_scored_avg', 1.5))
-        features.append(event_data.get('away_goals_scored_avg', 1.5))
-        features.append(event_data.get('home_goals_conceded_avg', 1.5))
-        features.append(event_data.get('away_goals_conceded_avg', 1.5))
+        return self.prepare_features_batch([event_data])
+
+    def prepare_features_batch(self, events_data: List[Dict[str, Any]]) -> np.ndarray:
+        """
+        Prepare one feature matrix for many events, in FEATURE_NAMES order
         
-        # Ranking/Rating
-        features.append(event_data.get('home_ranking', 50))
-        features.append(event_data.get('away_ranking', 50))
-        features.append(event_data.get('ranking_difference', 0))
+        Args:
+            events_data: List of raw event data
         
-        return np.array(features).reshape(1, -1)
+        Returns:
+            Feature array of shape (n_events, n_features)
+        """
+        defaults = [(name, self.FEATURE_DEFAULTS[name]) for name in self.FEATURE_NAMES]
+        rows = [
+            [event_data.get(name, default) for name, default in defaults]
+            for event_data in events_data
+        ]
+        return np.array(rows, dtype=float).reshape(len(rows), len(defaults))
     
     def train(
         self,
@@ -165,6 +174,7 @@ class XGBoostModel:
             )
             
             self.is_trained = True
+            self.clear_prediction_cache()
             
             # Calculate metrics
             train_score = self.model.score(X_train, y_train)
@@ -223,6 +233,65 @@ class XGBoostModel:
             logger.error(f"Error in XGBoost prediction: {e}")
             return self._default_prediction()
     
+    def predict_batch(self, events_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Make predictions for many events with a single model call
+        
+        Args:
+            events_data: List of event data
+        
+        Returns:
+            List of predictions with confidence, in input order
+        """
+        if not events_data:
+            return []
+
+        try:
+            if not self.is_trained:
+                logger.warning("Model not trained, using default prediction")
+                return [self._default_prediction() for _ in events_data]
+            
+            # One feature matrix; rows seen before are served from the cache
+            features = self.prepare_features_batch(events_data)
+            keys = [row.tobytes() for row in features]
+            with self._prediction_cache_lock:
+                results = [self._prediction_cache.get(key) for key in keys]
+            missing = [i for i, result in enumerate(results) if result is None]
+            
+            if missing:
+                # One predict_proba call for every uncached row
+                probabilities = self.model.predict_proba(features[missing])
+                computed = zip(
+                    probabilities.argmax(axis=1).tolist(),
+                    probabilities.max(axis=1).tolist(),
+                    probabilities[:, 1].tolist()
+                )
+                with self._prediction_cache_lock:
+                    for i, result in zip(missing, computed):
+                        results[i] = result
+                        self._prediction_cache[keys[i]] = result
+            
+            timestamp = datetime.utcnow().isoformat()
+            return [
+                {
+                    'prediction': label,
+                    'confidence': confidence,
+                    'probability': probability,
+                    'model': self.model_name,
+                    'timestamp': timestamp
+                }
+                for label, confidence, probability in results
+            ]
+            
+        except Exception as e:
+            logger.error(f"Error in XGBoost batch prediction: {e}")
+            return [self._default_prediction() for _ in events_data]
+    
+    def clear_prediction_cache(self):
+        """Drop memoized predictions (called whenever the underlying model changes)."""
+        with self._prediction_cache_lock:
+            self._prediction_cache.clear()
+    
     def _default_prediction(self) -> Dict[str, Any]:
         """Return default prediction"""
         return {
@@ -250,6 +319,9 @@ class XGBoostModel:
         """
         Save model to disk
         
+        Paths ending in .json/.ubj are written in XGBoost's native format;
+        any other path gets a pickled bundle with feature names and params.
+        
         Args:
             path: Save path
         """
@@ -262,12 +334,15 @@ class XGBoostModel:
         
         Path(path).parent.mkdir(parents=True, exist_ok=True)
         
-        with open(path, 'wb') as f:
-            pickle.dump({
-                'model': self.model,
-                'feature_names': self.feature_names,
-                'params': self.params
-            }, f)
+        if Path(path).suffix in NATIVE_MODEL_SUFFIXES:
+            self.model.save_model(path)
+        else:
+            with open(path, 'wb') as f:
+                pickle.dump({
+                    'model': self.model,
+                    'feature_names': self.feature_names,
+                    'params': self.params
+                }, f)
         
         logger.info(f"Model saved to {path}")
     
@@ -275,23 +350,62 @@ class XGBoostModel:
         """
         Load model from disk
         
+        The file is read through a read-only mmap, and the result is shared
+        across instances until the file's mtime or size changes.
+        
         Args:
             path: Model path
+        
+        Raises:
+            FileNotFoundError: If no model exists at path
         """
         try:
-            with open(path, 'rb') as f:
-                data = pickle.load(f)
+            stat = os.stat(path)
+            signature = (stat.st_mtime_ns, stat.st_size)
+            key = os.path.abspath(path)
+
+            with _loaded_models_lock:
+                cached = _loaded_models.get(key)
+                if cached is not None and cached[0] == signature:
+                    data = cached[1]
+                else:
+                    data = self._read_model_file(path)
+                    _loaded_models[key] = (signature, data)
             
             self.model = data['model']
-            self.feature_names = data['feature_names']
-            self.params = data['params']
+            self.feature_names = list(data['feature_names'])
+            self.params = dict(data['params'])
             self.is_trained = True
+            self.clear_prediction_cache()
             
             logger.info(f"Model loaded from {path}")
             
+        except FileNotFoundError:
+            raise
         except Exception as e:
             logger.error(f"Error loading model: {e}")
             raise
+
+    def _read_model_file(self, path: str) -> Dict[str, Any]:
+        """
+        Read a model bundle from disk via a read-only mmap
+        
+        Args:
+            path: Model path
+        
+        Returns:
+            Dictionary with model, feature_names and params
+        """
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if Path(path).suffix in NATIVE_MODEL_SUFFIXES:
+                model = xgb.XGBClassifier()
+                model.load_model(bytearray(mm))
+                return {
+                    'model': model,
+                    'feature_names': list(self.FEATURE_NAMES),
+                    'params': self.params
+                }
+            return pickle.loads(mm)
     
     def get_performance(self) -> Dict[str, Any]:
         """
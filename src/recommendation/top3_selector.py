@@ -3,13 +3,14 @@ Top 3 Bet Selector - Identifies the best 3 betting opportunities
 """
 from __future__ import annotations
 from typing import List, Dict, Any, Tuple
+import heapq
 import os
 from datetime import datetime, timedelta
 try:
     import numpy as np
 except ImportError:
     np = None
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, contains_eager, selectinload
 
 from src.database.models import Event, Odds, Recommendation
 from src.ml_models.ensemble_predictor import EnsemblePredictor
@@ -94,17 +95,33 @@ class Top3Selector:
             
             logger.info(f"Analyzing {len(upcoming_events)} upcoming events")
             
-            # Analyze each event and generate recommendations
-            recommendations = []
+            # Load current odds for every candidate event in one query
+            odds_by_event = self._get_current_odds(db, [event.id for event in upcoming_events])
             
+            analyzed = []
             for event in upcoming_events:
+                current_odds = odds_by_event.get(event.id)
+                if not current_odds:
+                    continue
                 try:
-                    event_recommendations = self._analyze_event(event, db)
-                    recommendations.extend(event_recommendations)
+                    analyzed.append((event, current_odds, self._prepare_event_data(event, current_odds)))
                 except Exception as e:
                     logger.error(f"Error analyzing event {event.id}: {e}")
                     continue
             
+            # Score all events with a single batched ensemble call
+            predictions = self.ensemble_predictor.batch_predict(
+                [event_data for _, _, event_data in analyzed]
+            )
+            
+            # Generate recommendations for each event's markets
+            timestamp = datetime.utcnow().isoformat()
+            recommendations = []
+            for (event, current_odds, event_data), prediction in zip(analyzed, predictions):
+                recommendations.extend(
+                    self._analyze_event(event, current_odds, prediction, event_data, timestamp)
+                )
+            
             # Filter by criteria
             filtered_recommendations = self._filter_recommendations(recommendations)
             
@@ -152,46 +169,69 @@ class Top3Selector:
         )
 
         if sport:
+            # Reuse the filtered join to populate Event.sport
             from src.database.models import Sport
-            query = query.join(Event.sport).filter(Sport.name == sport)
+            query = query.join(Event.sport).filter(Sport.name == sport).options(contains_eager(Event.sport))
+        else:
+            query = query.options(selectinload(Event.sport))
 
         events = query.all()
         
         return events
     
-    def _analyze_event(self, event: Event, db: Session) -> List[Dict[str, Any]]:
+    def _get_current_odds(self, db: Session, event_ids: List[int]) -> Dict[int, List[Odds]]:
         """
-        Analyze event and generate betting recommendations
+        Get current odds for many events, grouped by event
         
         Args:
-            event: Event to analyze
             db: Database session
+            event_ids: Event IDs to load odds for
         
         Returns:
-            List of recommendations for this event
+            Mapping of event ID to its current odds entries
         """
-        recommendations = []
-        
-        # Get current odds for the event
+        odds_by_event: Dict[int, List[Odds]] = {}
+        if not event_ids:
+            return odds_by_event
+
         current_odds = db.query(Odds).filter(
-            Odds.event_id == event.id,
+            Odds.event_id.in_(event_ids),
             Odds.is_current == True
-        ).all()
-        
-        if not current_odds:
-            return recommendations
+        ).order_by(Odds.id).all()
+
+        for odds_entry in current_odds:
+            odds_by_event.setdefault(odds_entry.event_id, []).append(odds_entry)
+
+        return odds_by_event
+    
+    def _analyze_event(
+        self,
+        event: Event,
+        current_odds: List[Odds],
+        prediction: Dict[str, Any],
+        event_data: Dict[str, Any],
+        timestamp: str = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate betting recommendations for an already-scored event
         
-        # Prepare event data for prediction
-        event_data = self._prepare_event_data(event, current_odds)
+        Args:
+            event: Event to analyze
+            current_odds: Current odds entries for the event
+            prediction: Ensemble prediction for the event
+            event_data: Event data used for the prediction
+            timestamp: ISO timestamp shared by this batch of recommendations
         
-        # Get ensemble prediction
-        prediction = self.ensemble_predictor.predict(event_data)
+        Returns:
+            List of recommendations for this event
+        """
+        recommendations = []
         
         # Generate recommendations for different markets
         for odds_entry in current_odds:
             try:
                 rec = self._create_recommendation(
-                    event, odds_entry, prediction, event_data
+                    event, odds_entry, prediction, event_data, timestamp
                 )
                 if rec:
                     recommendations.append(rec)
@@ -294,7 +334,8 @@ class Top3Selector:
         event: Event,
         odds: Odds,
         prediction: Dict[str, Any],
-        event_data: Dict[str, Any]
+        event_data: Dict[str, Any],
+        timestamp: str = None
     ) -> Dict[str, Any]:
         """
         Create betting recommendation
@@ -304,6 +345,7 @@ class Top3Selector:
             odds: Odds entry
             prediction: Model prediction
             event_data: Event data
+            timestamp: ISO timestamp for the recommendation (defaults to now)
         
         Returns:
             Recommendation dictionary
@@ -377,7 +419,7 @@ class Top3Selector:
             'rationale': rationale,
             'ensemble_scores': prediction.get('individual_confidences', {}),
             'model_weights': prediction.get('model_weights', {}),
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': timestamp or datetime.utcnow().isoformat()
         }
     
     # Tiered stake amounts based on model probability
@@ -576,24 +618,23 @@ class Top3Selector:
             
             rec['composite_score'] = composite_score
         
-        # Sort by composite score
-        ranked = sorted(
-            recommendations,
-            key=lambda x: x['composite_score'],
-            reverse=True
-        )
-        
-        # Select top 3, ensuring event diversity (max 1 per event)
-        top3 = []
-        seen_events = set()
-        for rec in ranked:
+        # Keep each event's best-scoring recommendation (max 1 per event);
+        # on ties the earlier recommendation wins, as with a stable sort
+        best_by_event = {}
+        for index, rec in enumerate(recommendations):
             eid = rec.get('event_id')
-            if eid in seen_events:
-                continue
-            seen_events.add(eid)
-            top3.append(rec)
-            if len(top3) >= 3:
-                break
+            best = best_by_event.get(eid)
+            if best is None or rec['composite_score'] > best[1]['composite_score']:
+                best_by_event[eid] = (index, rec)
+        
+        # Select top 3 by composite score without sorting every candidate
+        top3 = [
+            rec for _, rec in heapq.nlargest(
+                3,
+                best_by_event.values(),
+                key=lambda item: (item[1]['composite_score'], -item[0])
+            )
+        ]
         
         # Add rank
         for i, rec in enumerate(top3, 1):
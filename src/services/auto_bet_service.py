@@ -12,9 +12,10 @@ Ledger uses the existing Recommendation table (status: pending → won/lost/void
 import asyncio
 import os
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy import exists, func, select
+from sqlalchemy.orm import Session, selectinload
 
 from src.database.database import db_manager
 from src.database.models import Event, Odds, Recommendation, Sport
@@ -53,6 +54,9 @@ SCORE_LEAGUES = [
 
 MAX_SCORE_LEAGUES_PER_CYCLE = int(os.getenv("MAX_SCORE_LEAGUES", "4"))
 
+# Rows fetched per round-trip when walking the ledger
+LEDGER_BATCH_SIZE = 500
+
 
 # ──────────────────── Ensemble singleton ────────────────────────
 _ensemble: Optional[EnsemblePredictor] = None
@@ -63,16 +67,27 @@ def _get_ensemble() -> EnsemblePredictor:
     if _ensemble is None:
         _ensemble = EnsemblePredictor()
         xgb = XGBoostModel()
-        if os.path.exists(TRAINED_MODEL_PATH):
-            try:
-                xgb.load_model(TRAINED_MODEL_PATH)
-                logger.info(f"Auto-bet: loaded trained model from {TRAINED_MODEL_PATH}")
-            except Exception as e:
-                logger.warning(f"Auto-bet: model load failed: {e}")
+        try:
+            xgb.load_model(TRAINED_MODEL_PATH)
+            logger.info(f"Auto-bet: loaded trained model from {TRAINED_MODEL_PATH}")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Auto-bet: model load failed: {e}")
         _ensemble.register_model("xgboost", xgb)
     return _ensemble
 
 
+_selector: Optional[Top3Selector] = None
+
+
+def _get_selector() -> Top3Selector:
+    global _selector
+    if _selector is None:
+        _selector = Top3Selector(_get_ensemble())
+    return _selector
+
+
 # ════════════════════════════════════════════════════════════════
 #  1.  AUTO-BET: Record new recommendations into the ledger
 # ════════════════════════════════════════════════════════════════
@@ -99,9 +114,7 @@ def record_top3_bets(db: Session) -> List[Dict[str, Any]]:
 
     Returns the list of newly recorded recommendations.
     """
-    ensemble = _get_ensemble()
-    selector = Top3Selector(ensemble)
-    recs = selector.get_top3_bets(db)
+    recs = _get_selector().get_top3_bets(db)
 
     recorded = []
     for rec in recs:
@@ -159,6 +172,14 @@ def record_top3_bets(db: Session) -> List[Dict[str, Any]]:
 #  2.  RESULT GRADING: Check completed events & grade bets
 # ════════════════════════════════════════════════════════════════
 
+def _has_pending_bets() -> bool:
+    """Whether any ledger entry is pending (EXISTS stops at the first match)."""
+    with db_manager.get_read_session() as db:
+        return db.execute(
+            select(exists().where(Recommendation.status == "pending"))
+        ).scalar()
+
+
 async def grade_pending_bets() -> Dict[str, Any]:
     """
     For every pending bet in the ledger:
@@ -169,23 +190,40 @@ async def grade_pending_bets() -> Dict[str, Any]:
 
     Returns summary dict.
     """
-    odds_client = get_odds_client()
     graded = {"won": 0, "lost": 0, "void": 0, "still_pending": 0, "errors": 0}
 
-    # Fetch scores for priority leagues (costs 1 credit each)
-    completed_events: Dict[str, Dict] = {}
-    leagues_checked = 0
-    for league_key in SCORE_LEAGUES:
-        if leagues_checked >= MAX_SCORE_LEAGUES_PER_CYCLE:
-            break
+    # Nothing to grade: don't spend score-API credits
+    if not await asyncio.to_thread(_has_pending_bets):
+        logger.debug("Grade: no pending bets")
+        return graded
+
+    odds_client = get_odds_client()
+
+    async def fetch_scores(league_key: str) -> Optional[List[Dict]]:
         try:
-            scores = await odds_client.get_scores(league_key, days_from=3)
-            for ev in scores:
-                if ev.get("completed"):
-                    completed_events[ev["id"]] = ev
-            leagues_checked += 1
+            return await odds_client.get_scores(league_key, days_from=3)
         except Exception as e:
             logger.error(f"Error fetching scores for {league_key}: {e}")
+            return None
+
+    # Fetch scores for priority leagues concurrently (costs 1 credit each);
+    # MAX_SCORE_LEAGUES_PER_CYCLE bounds the fan-out
+    async with asyncio.TaskGroup() as tg:
+        tasks = [
+            tg.create_task(fetch_scores(league_key))
+            for league_key in SCORE_LEAGUES[:MAX_SCORE_LEAGUES_PER_CYCLE]
+        ]
+
+    completed_events: Dict[str, Dict] = {}
+    leagues_checked = 0
+    for task in tasks:
+        scores = task.result()
+        if scores is None:
+            continue
+        leagues_checked += 1
+        for ev in scores:
+            if ev.get("completed"):
+                completed_events[ev["id"]] = ev
 
     if not completed_events:
         logger.debug("Grade: no completed events found from scores API")
@@ -328,90 +366,138 @@ def _selection_matches_winner(
 #  3.  LEDGER QUERIES
 # ════════════════════════════════════════════════════════════════
 
+def _ledger_entry(e: Recommendation) -> Dict[str, Any]:
+    """
+    Serialize one ledger row (recommendation with its event loaded).
+
+    Datetimes are left as-is for the (orjson) encoder to emit as ISO 8601.
+    """
+    event = e.event
+    return {
+        "id": e.id,
+        "event_id": e.event_id,
+        "event_name": event.name if event else "Unknown",
+        "sport": event.sport.name if event and event.sport else "unknown",
+        "start_time": event.start_time if event else None,
+        "selection": e.selection,
+        "recommended_odds": e.recommended_odds,
+        "confidence_score": e.confidence_score,
+        "expected_value": e.expected_value,
+        "recommended_stake": e.recommended_stake,
+        "status": e.status or "pending",
+        "actual_outcome": e.actual_outcome,
+        "actual_return": e.actual_return,
+        "profit": round(
+            (e.actual_return or 0) - (e.recommended_stake or 0), 2
+        ) if e.status in ("won", "lost") else None,
+        "created_at": e.created_at,
+        "updated_at": e.updated_at,
+    }
+
+
+def _ledger_query(db: Session, limit: int, status_filter: Optional[str]):
+    """Newest-first ledger query with events and sports eager-loaded."""
+    q = (
+        db.query(Recommendation)
+        .options(selectinload(Recommendation.event).selectinload(Event.sport))
+        .order_by(Recommendation.created_at.desc())
+    )
+    if status_filter:
+        q = q.filter(Recommendation.status == status_filter)
+    return q.limit(limit)
+
+
+def iter_ledger(
+    db: Session,
+    limit: int = 100,
+    status_filter: Optional[str] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield ledger entries newest first, LEDGER_BATCH_SIZE rows per fetch.
+
+    Events and sports are eager-loaded per batch, so memory stays bounded
+    by the batch size rather than `limit`. The server-side cursor this
+    uses needs `db` to be inside a transaction on PostgreSQL.
+    """
+    for e in _ledger_query(db, limit, status_filter).yield_per(LEDGER_BATCH_SIZE):
+        yield _ledger_entry(e)
+
+
 def get_ledger(
     db: Session,
     limit: int = 100,
     status_filter: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
     """Return the bet ledger with P&L information."""
-    q = db.query(Recommendation).order_by(Recommendation.created_at.desc())
-    if status_filter:
-        q = q.filter(Recommendation.status == status_filter)
-    entries = q.limit(limit).all()
-
-    results = []
-    for e in entries:
-        event = db.query(Event).filter(Event.id == e.event_id).first()
-        results.append({
-            "id": e.id,
-            "event_id": e.event_id,
-            "event_name": event.name if event else "Unknown",
-            "sport": event.sport.name if event and event.sport else "unknown",
-            "start_time": event.start_time.isoformat() if event and event.start_time else None,
-            "selection": e.selection,
-            "recommended_odds": e.recommended_odds,
-            "confidence_score": e.confidence_score,
-            "expected_value": e.expected_value,
-            "recommended_stake": e.recommended_stake,
-            "status": e.status or "pending",
-            "actual_outcome": e.actual_outcome,
-            "actual_return": e.actual_return,
-            "profit": round(
-                (e.actual_return or 0) - (e.recommended_stake or 0), 2
-            ) if e.status in ("won", "lost") else None,
-            "created_at": e.created_at.isoformat() if e.created_at else None,
-            "updated_at": e.updated_at.isoformat() if e.updated_at else None,
-        })
-    return results
+    # The whole list is built anyway, so a plain buffered fetch (no
+    # server-side cursor) is enough
+    return [_ledger_entry(e) for e in _ledger_query(db, limit, status_filter)]
 
 
 def get_ledger_summary(db: Session) -> Dict[str, Any]:
     """Aggregate P&L stats from the ledger."""
-    all_recs = db.query(Recommendation).all()
+    # One GROUP BY pass: per-status count, stake and return totals
+    rows = (
+        db.query(
+            Recommendation.status,
+            func.count(Recommendation.id),
+            func.sum(Recommendation.recommended_stake),
+            func.sum(Recommendation.actual_return),
+        )
+        .group_by(Recommendation.status)
+        .all()
+    )
+    counts = {status: count for status, count, _, _ in rows}
+    graded = [row for row in rows if row[0] in ("won", "lost")]
 
-    total = len(all_recs)
-    won = [r for r in all_recs if r.status == "won"]
-    lost = [r for r in all_recs if r.status == "lost"]
-    pending = [r for r in all_recs if r.status == "pending"]
-    void = [r for r in all_recs if r.status == "void"]
+    total = sum(counts.values())
+    won = counts.get("won", 0)
+    lost = counts.get("lost", 0)
 
-    total_staked = sum(r.recommended_stake or 0 for r in all_recs if r.status in ("won", "lost"))
-    total_returned = sum(r.actual_return or 0 for r in all_recs if r.status in ("won", "lost"))
+    total_staked = sum(staked or 0 for _, _, staked, _ in graded)
+    total_returned = sum(returned or 0 for _, _, _, returned in graded)
     net_profit = round(total_returned - total_staked, 2)
     roi = round((net_profit / total_staked) * 100, 2) if total_staked > 0 else 0.0
 
     return {
         "total_bets": total,
-        "won": len(won),
-        "lost": len(lost),
-        "pending": len(pending),
-        "void": len(void),
-        "win_rate": round(len(won) / (len(won) + len(lost)) * 100, 2) if (len(won) + len(lost)) > 0 else 0.0,
+        "won": won,
+        "lost": lost,
+        "pending": counts.get("pending", 0),
+        "void": counts.get("void", 0),
+        "win_rate": round(won / (won + lost) * 100, 2) if (won + lost) > 0 else 0.0,
         "total_staked": round(total_staked, 2),
         "total_returned": round(total_returned, 2),
         "net_profit": net_profit,
         "roi": roi,
-        "current_streak": _get_streak(all_recs),
+        "current_streak": _get_streak(db),
     }
 
 
-def _get_streak(recs: list) -> Dict[str, Any]:
+def _get_streak(db: Session) -> Dict[str, Any]:
     """Calculate current win/loss streak from most recent graded bets."""
-    graded = sorted(
-        [r for r in recs if r.status in ("won", "lost")],
-        key=lambda r: r.updated_at or r.created_at,
-        reverse=True,
+    # Walk graded statuses newest first and stop at the first change
+    statuses = (
+        db.query(Recommendation.status)
+        .filter(Recommendation.status.in_(("won", "lost")))
+        .order_by(
+            func.coalesce(Recommendation.updated_at, Recommendation.created_at).desc(),
+            Recommendation.id,
+        )
+        .yield_per(LEDGER_BATCH_SIZE)
     )
-    if not graded:
-        return {"type": "none", "count": 0}
 
-    streak_type = graded[0].status
+    streak_type = None
     count = 0
-    for r in graded:
-        if r.status == streak_type:
-            count += 1
-        else:
+    for (status,) in statuses:
+        if streak_type is None:
+            streak_type = status
+        elif status != streak_type:
             break
+        count += 1
+
+    if streak_type is None:
+        return {"type": "none", "count": 0}
     return {"type": streak_type, "count": count}
 
 
@@ -422,6 +508,12 @@ def _get_streak(recs: list) -> Dict[str, Any]:
 _running = False
 
 
+def _record_top3_bets_in_session() -> List[Dict[str, Any]]:
+    """Run record_top3_bets in its own session (for use from a worker thread)."""
+    with db_manager.get_session() as db:
+        return record_top3_bets(db)
+
+
 async def auto_bet_loop():
     """
     Main background loop:
@@ -454,10 +546,10 @@ async def auto_bet_loop():
                 logger.error(f"Auto-bet: odds refresh failed: {e}")
 
         # ── Record new bets ──
+        # Selection + model inference is synchronous; keep it off the event loop
         if (now - last_bet_time).total_seconds() >= BET_INTERVAL_SECONDS:
             try:
-                with db_manager.get_session() as db:
-                    recorded = record_top3_bets(db)
+                recorded = await asyncio.to_thread(_record_top3_bets_in_session)
                 last_bet_time = now
             except Exception as e:
                 logger.error(f"Auto-bet: bet recording failed: {e}")
@@ -3,6 +3,7 @@ Configuration loader for the Betting AI System
 """
 import os
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 from dotenv import load_dotenv
@@ -130,15 +131,12 @@ class ConfigLoader:
         logger.info("Configuration reloaded")
 
 
-# Global configuration instance
-config = ConfigLoader()
-
-
+@lru_cache(maxsize=1)
 def get_config() -> ConfigLoader:
     """
-    Get global configuration instance
+    Get global configuration instance (YAML is parsed once per process)
     
     Returns:
         Configuration loader instance
     """
-    return config
+    return ConfigLoader()
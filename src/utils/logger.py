@@ -3,14 +3,16 @@ Logging configuration for the Betting AI System
 """
 import logging
 import sys
+from functools import lru_cache
 from pathlib import Path
 from logging.handlers import RotatingFileHandler
 from pythonjsonlogger import jsonlogger
 
 
+@lru_cache(maxsize=None)
 def get_logger(name: str, log_level: str = "INFO") -> logging.Logger:
     """
-    Get configured logger instance
+    Get configured logger instance (memoized per name/level)
     
     Args:
         name: Logger name (typically __name__)